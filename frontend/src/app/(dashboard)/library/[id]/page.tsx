@@ -102,7 +102,7 @@ export default function LibraryDetailPage({
 
   const vulns = usePaginatedQuery<UpstreamVulnItem>({
     queryKey: queryKeys.upstreamVulns.list(undefined, id),
-    path: `/api/v1/upstream-vulns/?library_id=${id}`,
+    path: `/api/v1/upstream-vulns/?library_id=${id}&include_total=true`,
     pageSize: 20,
   });
 
@@ -29,7 +29,7 @@ export default function UpstreamVulnsPage() {
 
   const vulns = usePaginatedQuery<UpstreamVulnItem>({
     queryKey: queryKeys.upstreamVulns.all,
-    path: "/api/v1/upstream-vulns/",
+    path: "/api/v1/upstream-vulns/?include_total=true",
   });
 
   const columns: Column<UpstreamVulnItem>[] = [
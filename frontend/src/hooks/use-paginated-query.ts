@@ -30,7 +30,8 @@ export function usePaginatedQuery<T>({ queryKey, path, pageSize = 20 }: UsePagin
       const params = new URLSearchParams();
       params.set("page_size", String(pageSize));
       if (cursor) params.set("cursor", cursor);
-      return apiFetch<PaginatedResponse<T>>(`${path}?${params}`);
+      const sep = path.includes("?") ? "&" : "?";
+      return apiFetch<PaginatedResponse<T>>(`${path}${sep}${params}`);
     },
   });
 
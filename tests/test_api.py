@@ -0,0 +1,304 @@
+"""Tests for the CodeAnalyzer facade helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from z_code_analyzer.api import CodeAnalyzer, VulnImpactRequest, _auto_clone
+from z_code_analyzer.reachability import ReachabilityResult
+
+
+def _git(*args: str, cwd: Path) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def origin(tmp_path):
+    """A local repo with two commits and a tag on the first one."""
+    repo = tmp_path / "origin"
+    repo.mkdir()
+    _git("init", "-q", cwd=repo)
+    _git("config", "user.email", "t@example.com", cwd=repo)
+    _git("config", "user.name", "t", cwd=repo)
+    _git("config", "uploadpack.allowFilter", "true", cwd=repo)
+    (repo / "a.c").write_text("int a(void) { return 1; }\n")
+    _git("add", "a.c", cwd=repo)
+    _git("commit", "-q", "-m", "one", cwd=repo)
+    _git("tag", "v1.0", cwd=repo)
+    first = _git("rev-parse", "HEAD", cwd=repo)
+    (repo / "a.c").write_text("int a(void) { return 2; }\n")
+    _git("commit", "-q", "-am", "two", cwd=repo)
+    return repo, first
+
+
+class TestAutoClone:
+    def test_clone_tag(self, origin, tmp_path):
+        repo, _ = origin
+        out = _auto_clone(f"file://{repo}", "v1.0", str(tmp_path / "ws"))
+        assert "return 1" in (Path(out) / "a.c").read_text()
+
+    def test_clone_full_sha(self, origin, tmp_path):
+        repo, first = origin
+        out = _auto_clone(f"file://{repo}", first, str(tmp_path / "ws"))
+        assert "return 1" in (Path(out) / "a.c").read_text()
+
+    def test_clone_full_sha_is_shallow(self, origin, tmp_path):
+        repo, first = origin
+        out = _auto_clone(f"file://{repo}", first, str(tmp_path / "ws"))
+        assert _git("rev-parse", "HEAD", cwd=Path(out)) == first
+        assert _git("rev-parse", "--is-shallow-repository", cwd=Path(out)) == "true"
+
+    def test_clone_abbreviated_sha_falls_back(self, origin, tmp_path):
+        repo, first = origin
+        out = _auto_clone(f"file://{repo}", first[:10], str(tmp_path / "ws"))
+        assert "return 1" in (Path(out) / "a.c").read_text()
+
+    def test_unknown_version_raises_and_cleans_up(self, origin, tmp_path):
+        repo, _ = origin
+        ws = tmp_path / "ws"
+        with pytest.raises(RuntimeError, match="Git clone/checkout failed"):
+            _auto_clone(f"file://{repo}", "no-such-ref", str(ws))
+        assert list(ws.iterdir()) == []
+
+    def test_timeout_raises_and_cleans_up(self, origin, tmp_path):
+        repo, _ = origin
+        ws = tmp_path / "ws"
+        with pytest.raises(RuntimeError, match="timed out"):
+            _auto_clone(f"file://{repo}", "v1", str(ws), timeout=0)
+        assert list(ws.iterdir()) == []
+
+
+def _request() -> VulnImpactRequest:
+    return VulnImpactRequest(
+        client_repo_url="https://github.com/foo/client",
+        client_version="v1",
+        library_repo_url="https://github.com/foo/lib",
+        library_version="v2",
+        affected_functions=["vuln_fn"],
+    )
+
+
+class TestInvestigateVuln:
+    @pytest.mark.asyncio
+    async def test_snapshots_ensured_concurrently(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        async def _ensure(repo_url, version, project_path=None):
+            started.append(repo_url)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return f"sid-{version}", None
+
+        analyzer._ensure_snapshot = _ensure
+        analyzer._checker.check = AsyncMock(
+            return_value=ReachabilityResult(
+                is_reachable=True,
+                searched_functions=["vuln_fn"],
+                client_snapshot_id="sid-v1",
+                library_snapshot_id="sid-v2",
+            )
+        )
+
+        result = await analyzer.investigate_vuln(_request())
+
+        assert result.is_reachable is True
+        assert len(started) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_reported_first(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+
+        async def _ensure(repo_url, version, project_path=None):
+            return None, f"boom-{version}"
+
+        analyzer._ensure_snapshot = _ensure
+        result = await analyzer.investigate_vuln(_request())
+
+        assert result.is_reachable is False
+        assert result.error == "client_snapshot_build_failed: boom-v1"
+
+    @pytest.mark.asyncio
+    async def test_library_error_keeps_client_sid(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+
+        async def _ensure(repo_url, version, project_path=None):
+            if version == "v2":
+                return None, "boom"
+            return "sid-v1", None
+
+        analyzer._ensure_snapshot = _ensure
+        result = await analyzer.investigate_vuln(_request())
+
+        assert result.client_snapshot_id == "sid-v1"
+        assert result.error == "library_snapshot_build_failed: boom"
+
+    @pytest.mark.asyncio
+    async def test_evicted_snapshot_rebuilt_and_rechecked(self):
+        sm = MagicMock()
+        sm.find_snapshot.side_effect = lambda url, version: MagicMock(id=f"sid-{version}")
+        analyzer = CodeAnalyzer(sm, MagicMock())
+        analyzer._remember_snapshot("https://github.com/foo/lib", "v2", "sid-evicted")
+        analyzer._checker.check = AsyncMock(
+            side_effect=[
+                ReachabilityResult(
+                    is_reachable=False,
+                    searched_functions=["vuln_fn"],
+                    error="library_snapshot_not_found",
+                ),
+                ReachabilityResult(is_reachable=True, searched_functions=["vuln_fn"]),
+            ]
+        )
+
+        result = await analyzer.investigate_vuln(_request())
+
+        assert result.is_reachable is True
+        assert result.error is None
+        assert analyzer._checker.check.await_count == 2
+        # The stale id was dropped and the library looked up again
+        assert analyzer._snap_cache[("https://github.com/foo/lib", "v2")] == "sid-v2"
+
+    @pytest.mark.asyncio
+    async def test_evicted_snapshot_checked_only_once_more(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+
+        async def _ensure(repo_url, version, project_path=None):
+            return f"sid-{version}", None
+
+        analyzer._ensure_snapshot = _ensure
+        analyzer._checker.check = AsyncMock(
+            return_value=ReachabilityResult(
+                is_reachable=False,
+                searched_functions=["vuln_fn"],
+                error="client_snapshot_not_found",
+            )
+        )
+
+        result = await analyzer.investigate_vuln(_request())
+
+        assert result.error == "client_snapshot_not_found"
+        assert analyzer._checker.check.await_count == 2
+
+
+class TestEnsureSnapshotSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_same_key_builds_once(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+        release = asyncio.Event()
+        calls: list[tuple[str, str]] = []
+
+        async def _build(repo_url, version, project_path):
+            calls.append((repo_url, version))
+            await release.wait()
+            return "sid-1", None
+
+        analyzer._find_or_build_snapshot = _build
+
+        first = asyncio.create_task(analyzer._ensure_snapshot("https://x/repo", "v1"))
+        second = asyncio.create_task(analyzer._ensure_snapshot("https://x/repo", "v1"))
+        other = asyncio.create_task(analyzer._ensure_snapshot("https://x/repo", "v2"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == ("sid-1", None)
+        assert await second == ("sid-1", None)
+        assert await other == ("sid-1", None)
+        assert calls == [("https://x/repo", "v1"), ("https://x/repo", "v2")]
+        assert analyzer._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_registry_cleared_after_completion(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+        analyzer._find_or_build_snapshot = AsyncMock(return_value=(None, "boom"))
+
+        assert await analyzer._ensure_snapshot("https://x/repo", "v1") == (None, "boom")
+        assert await analyzer._ensure_snapshot("https://x/repo", "v1") == (None, "boom")
+        assert analyzer._find_or_build_snapshot.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_build_error_reaches_every_caller(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+        release = asyncio.Event()
+
+        async def _build(repo_url, version, project_path):
+            await release.wait()
+            raise RuntimeError("db down")
+
+        analyzer._find_or_build_snapshot = _build
+
+        first = asyncio.create_task(analyzer._ensure_snapshot("https://x/repo", "v1"))
+        second = asyncio.create_task(analyzer._ensure_snapshot("https://x/repo", "v1"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == (None, "db down")
+        assert await second == (None, "db down")
+        assert analyzer._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_builder_hands_over_to_waiter(self):
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+        release = asyncio.Event()
+        calls = 0
+
+        async def _build(repo_url, version, project_path):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return f"sid-{calls}", None
+
+        analyzer._find_or_build_snapshot = _build
+
+        first = asyncio.create_task(analyzer._ensure_snapshot("https://x/repo", "v1"))
+        second = asyncio.create_task(analyzer._ensure_snapshot("https://x/repo", "v1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == ("sid-2", None)
+        assert calls == 2
+        assert analyzer._inflight == {}
+
+
+class TestSnapshotIdCache:
+    @pytest.mark.asyncio
+    async def test_db_hit_cached(self):
+        sm = MagicMock()
+        sm.find_snapshot.return_value = MagicMock(id="sid-1")
+        analyzer = CodeAnalyzer(sm, MagicMock())
+
+        assert await analyzer._ensure_snapshot("https://x/repo", "v1") == ("sid-1", None)
+        assert await analyzer._ensure_snapshot("https://x/repo", "v1") == ("sid-1", None)
+        assert sm.find_snapshot.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_lookup(self):
+        sm = MagicMock()
+        sm.find_snapshot.return_value = MagicMock(id="sid-1")
+        analyzer = CodeAnalyzer(sm, MagicMock())
+
+        await analyzer._ensure_snapshot("https://x/repo", "v1")
+        analyzer.invalidate_snapshot("https://x/repo", "v1")
+        await analyzer._ensure_snapshot("https://x/repo", "v1")
+        assert sm.find_snapshot.call_count == 2
+
+    def test_lru_bounded(self, monkeypatch):
+        monkeypatch.setattr(CodeAnalyzer, "_SNAPSHOT_CACHE_SIZE", 2)
+        analyzer = CodeAnalyzer(MagicMock(), MagicMock())
+        analyzer._remember_snapshot("r", "v1", "a")
+        analyzer._remember_snapshot("r", "v2", "b")
+        analyzer._remember_snapshot("r", "v1", "a")
+        analyzer._remember_snapshot("r", "v3", "c")
+        assert list(analyzer._snap_cache) == [("r", "v1"), ("r", "v3")]
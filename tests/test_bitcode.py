@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import os
+import sqlite3
+import tempfile
 from pathlib import Path
 
+import pytest
+
+from z_code_analyzer.build import bitcode
 from z_code_analyzer.build.bitcode import BitcodeGenerator
 
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(bitcode, "ENRICH_CACHE_PATH", tmp_path / "cache" / "enrich.sqlite")
+    monkeypatch.setattr(bitcode, "METAS_CACHE_DIR", tmp_path / "cache" / "metas")
+
+
 # Minimal LLVM IR .ll content with DISubprogram and DIFile metadata
 SAMPLE_LL = """
 ; ModuleID = 'library.bc'
@@ -77,6 +90,84 @@ class TestLLParsing:
         metas = BitcodeGenerator._parse_ll_debug_info(ll_file, "/tmp")
         assert len(metas) == 0
 
+    def test_parse_parens_in_entry(self, tmp_path: Path):
+        ll_file = tmp_path / "library.ll"
+        ll_file.write_text(
+            '!1 = !DIFile(filename: "a.cc", directory: "/src/proj")\n'
+            '!10 = distinct !DISubprogram(name: "operator()", linkageName: "_ZN1AclEv", '
+            "file: !1, line: 3, flags: (DIFlagPrototyped | DIFlagPublic))\n"
+            '!20 = distinct !DISubprogram(name: "deep", flags: ((DIFlagA)), file: !1, line: 9)\n'
+            # Not alone on its line: found by paren counting instead
+            '!30 = distinct !DISubprogram(name: "split",\n  file: !1, line: 12) !31 = !{}\n'
+        )
+        metas = BitcodeGenerator._parse_ll_debug_info(ll_file, "/src/proj")
+        assert [(m.original_name, m.ir_name, m.line) for m in metas] == [
+            ("operator()", "_ZN1AclEv", 3),
+            ("deep", "deep", 9),
+            ("split", "split", 12),
+        ]
+
+    def test_parse_fields_in_any_order(self, tmp_path: Path):
+        ll_file = tmp_path / "library.ll"
+        ll_file.write_text(
+            '!1 = !DIFile(filename: "a.c", directory: "/src/proj")\n'
+            '!10 = distinct !DISubprogram(name: "f", scope: null, file: !1, line: 4)\n'
+            '!20 = distinct !DISubprogram(line: 8, file: !1, linkageName: "g.1", name: "g")\n'
+            '!30 = distinct !DISubprogram(name: "nofile", scope: !1, line: 2)\n'
+        )
+        metas = BitcodeGenerator._parse_ll_debug_info(ll_file, "/src/proj")
+        assert [(m.original_name, m.ir_name, m.file_path, m.line) for m in metas] == [
+            ("f", "f", "a.c", 4),
+            ("g", "g.1", "a.c", 8),
+        ]
+
+    def test_parse_shares_file_path_strings(self, tmp_path: Path):
+        ll_file = tmp_path / "library.ll"
+        ll_file.write_text(
+            '!1 = !DIFile(filename: "a.c", directory: "/src/proj")\n'
+            '!2 = !DIFile(filename: "a.c", directory: "/src/proj")\n'
+            '!10 = distinct !DISubprogram(name: "f", scope: !1, file: !1, line: 1)\n'
+            '!20 = distinct !DISubprogram(name: "g", scope: !1, file: !1, line: 5)\n'
+            '!30 = distinct !DISubprogram(name: "h", scope: !2, file: !2, line: 9)\n'
+        )
+        f, g, h = BitcodeGenerator._parse_ll_debug_info(ll_file, "/src/proj")
+        assert f.file_path == "a.c"
+        assert f.file_path is g.file_path is h.file_path
+
+    def test_parse_skips_duplicate_entries(self, tmp_path: Path):
+        ll_file = tmp_path / "library.ll"
+        ll_file.write_text(
+            '!1 = !DIFile(filename: "a.c", directory: "/src/proj")\n'
+            '!2 = !DIFile(filename: "a.c", directory: "/src/proj")\n'
+            '!10 = !DISubprogram(name: "f", scope: !1, file: !1, line: 3, spFlags: 0)\n'
+            '!20 = distinct !DISubprogram(name: "f", scope: !2, file: !2, line: 3)\n'
+            '!30 = distinct !DISubprogram(name: "f", linkageName: "f.1", file: !1, line: 3)\n'
+        )
+        metas = BitcodeGenerator._parse_ll_debug_info(ll_file, "/src/proj")
+        assert [(m.ir_name, m.line) for m in metas] == [("f", 3), ("f.1", 3)]
+
+    def test_parse_large_file_not_skipped(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(BitcodeGenerator, "_LARGE_LL_SIZE", 16)
+        ll_file = tmp_path / "library.ll"
+        ll_file.write_text(SAMPLE_LL)
+        assert len(BitcodeGenerator._parse_ll_debug_info(ll_file, "/src/myproject")) == 2
+
+    def test_parse_zero_byte_file(self, tmp_path: Path):
+        ll_file = tmp_path / "empty.ll"
+        ll_file.write_bytes(b"")
+        assert BitcodeGenerator._parse_ll_debug_info(ll_file, "/tmp") == []
+
+    def test_parse_non_utf8_bytes(self, tmp_path: Path):
+        ll_file = tmp_path / "library.ll"
+        ll_file.write_bytes(
+            SAMPLE_LL_RENAMED.replace('filename: "lib/a.c"', 'filename: "lib/\xe9.c"')
+            .encode()
+            .replace(b"\xc3\xa9", b"\xe9")
+        )
+        (m,) = BitcodeGenerator._parse_ll_debug_info(ll_file, "/src/proj")
+        assert m.original_name == "init"
+        assert m.file_path == "lib/\ufffd.c"
+
 
 class TestEnrichFromSource:
     """Test _enrich_from_source — reads actual C files to populate end_line/content."""
@@ -137,19 +228,164 @@ class TestEnrichFromSource:
         BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
         assert metas[0].end_line == 0
 
+    def test_functions_inside_extern_c_block(self, tmp_path: Path):
+        """Each function maps to its own body, not the enclosing block."""
+        from z_code_analyzer.models.build import FunctionMeta
+
+        (tmp_path / "a.c").write_text(
+            'extern "C" {\n'
+            "int f(void)\n"  # line 2
+            "{\n"
+            "    return 1; /* } */\n"
+            "}\n"  # line 5
+            "int g(void) { return 2; }\n"  # line 6
+            "}\n"
+        )
+        metas = [
+            FunctionMeta(ir_name="g", original_name="g", file_path="a.c", line=6),
+            FunctionMeta(ir_name="f", original_name="f", file_path="a.c", line=2),
+        ]
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
+        assert [m.end_line for m in metas] == [6, 5]
+        assert metas[0].content == "int g(void) { return 2; }"
+
+    def test_form_feed_does_not_shift_lines(self, tmp_path: Path):
+        """Lines are counted by \\n only, like DWARF line numbers."""
+        from z_code_analyzer.models.build import FunctionMeta
+
+        (tmp_path / "a.c").write_text("/* page */\f\nint f(void)\n{\n    return 0;\n}\n")
+        metas = [FunctionMeta(ir_name="f", original_name="f", file_path="a.c", line=2)]
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
+        assert metas[0].end_line == 5
+        assert metas[0].content == "int f(void)\n{\n    return 0;\n}"
 
-class TestFindFunctionEnd:
-    """Test _find_function_end — brace-counting logic."""
+    def test_crlf_source(self, tmp_path: Path):
+        from z_code_analyzer.models.build import FunctionMeta
+
+        (tmp_path / "a.c").write_bytes(b"// hdr\r\nint f(void)\r\n{\r\n    return 0;\r\n}\r\n")
+        metas = [FunctionMeta(ir_name="f", original_name="f", file_path="a.c", line=2)]
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
+        assert metas[0].end_line == 5
+        assert metas[0].content == "int f(void)\n{\n    return 0;\n}"
+
+    def test_many_files_use_process_pool(self, tmp_path: Path):
+        from z_code_analyzer.build.bitcode import _ENRICH_POOL_MIN_FILES
+        from z_code_analyzer.models.build import FunctionMeta
 
-    def test_simple_function(self):
+        metas = []
+        for i in range(_ENRICH_POOL_MIN_FILES + 1):
+            (tmp_path / f"f{i}.c").write_text(f"\nint f{i}(void)\n{{\n    return {i};\n}}\n")
+            metas.append(
+                FunctionMeta(ir_name=f"f{i}", original_name=f"f{i}", file_path=f"f{i}.c", line=2)
+            )
+        metas.append(FunctionMeta(ir_name="x", original_name="x", file_path="gone.c", line=1))
+
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
+        assert all(m.end_line == 5 for m in metas[:-1])
+        assert metas[3].content == "int f3(void)\n{\n    return 3;\n}"
+        assert metas[-1].end_line == 0 and metas[-1].content == ""
+
+    def test_second_run_served_from_cache(self, tmp_path: Path, monkeypatch):
+        from z_code_analyzer.models.build import FunctionMeta
+
+        def make_metas():
+            return [FunctionMeta(ir_name="f", original_name="f", file_path="a.c", line=1)]
+
+        src = tmp_path / "a.c"
+        src.write_text("int f(void)\n{\n    return 0;\n}\n")
+        BitcodeGenerator._enrich_from_source(make_metas(), str(tmp_path))
+
+        scanned = []
+        real = bitcode._enrich_one_file
+        monkeypatch.setattr(
+            bitcode, "_enrich_one_file", lambda *a: scanned.append(a[0]) or real(*a)
+        )
+        metas = make_metas()
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
+        assert scanned == []
+        assert metas[0].end_line == 4
+        assert metas[0].content == "int f(void)\n{\n    return 0;\n}"
+
+        # Any change to the file's text invalidates its entries
+        src.write_text("int f(void)\n{\n    return 10;\n}\n")
+        metas = make_metas()
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
+        assert scanned == [str(src)]
+        assert "return 10;" in metas[0].content
+
+    def test_cache_keyed_by_content_not_path(self, tmp_path: Path, monkeypatch):
+        from z_code_analyzer.models.build import FunctionMeta
+
+        source = "int f(void)\n{\n    return 0;\n}\n"
+        for clone in ("clone1", "clone2"):
+            (tmp_path / clone).mkdir()
+            (tmp_path / clone / "a.c").write_text(source)
+        BitcodeGenerator._enrich_from_source(
+            [FunctionMeta(ir_name="f", original_name="f", file_path="a.c", line=1)],
+            str(tmp_path / "clone1"),
+        )
+
+        scanned = []
+        real = bitcode._enrich_one_file
+        monkeypatch.setattr(
+            bitcode, "_enrich_one_file", lambda *a: scanned.append(a[0]) or real(*a)
+        )
+        metas = [FunctionMeta(ir_name="f", original_name="f", file_path="a.c", line=1)]
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path / "clone2"))
+        assert scanned == []
+        assert (metas[0].end_line, metas[0].content) == (4, source.rstrip("\n"))
+        # Only end lines are stored, never the source itself
+        assert b"return 0" not in bitcode.ENRICH_CACHE_PATH.read_bytes()
+
+    def test_cache_evicts_least_recently_used(self, tmp_path: Path, monkeypatch):
+        from z_code_analyzer.models.build import FunctionMeta
+
+        monkeypatch.setattr(bitcode, "_ENRICH_CACHE_MAX_ROWS", 2)
+        clock = iter(range(100))
+        monkeypatch.setattr(bitcode.time, "time", lambda: next(clock))
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.c").write_text(f"int {name}(void) {{ return 0; }}\n")
+            BitcodeGenerator._enrich_from_source(
+                [FunctionMeta(ir_name=name, original_name=name, file_path=f"{name}.c", line=1)],
+                str(tmp_path),
+            )
+
+        conn = sqlite3.connect(bitcode.ENRICH_CACHE_PATH)
+        used = [row[0] for row in conn.execute("SELECT used FROM function_ends ORDER BY used")]
+        conn.close()
+        assert used == [1, 2]
+
+    def test_unusable_cache_is_ignored(self, tmp_path: Path, monkeypatch):
+        from z_code_analyzer.models.build import FunctionMeta
+
+        (tmp_path / "blocker").write_text("")  # a file where the cache dir should be
+        monkeypatch.setattr(bitcode, "ENRICH_CACHE_PATH", tmp_path / "blocker" / "enrich.sqlite")
+        (tmp_path / "a.c").write_text("int f(void) { return 0; }\n")
+        metas = [FunctionMeta(ir_name="f", original_name="f", file_path="a.c", line=1)]
+        BitcodeGenerator._enrich_from_source(metas, str(tmp_path))
+        assert metas[0].content == "int f(void) { return 0; }"
+
+
+class TestFunctionEnd:
+    """Test _enrich_one_file's brace-counting end lines."""
+
+    @staticmethod
+    def _end(tmp_path: Path, lines: list[str]) -> int:
+        """0-based index of the line ending the function that starts on line 0."""
+        src = tmp_path / "f.c"
+        src.write_text("\n".join(lines) + "\n")
+        ((end_line, _),) = bitcode._enrich_one_file(str(src), [1])
+        return end_line - 1
+
+    def test_simple_function(self, tmp_path: Path):
         lines = [
             "void f() {",  # 0
             "    return;",
             "}",  # 2
         ]
-        assert BitcodeGenerator._find_function_end(lines, 0) == 2
+        assert self._end(tmp_path, lines) == 2
 
-    def test_nested_braces(self):
+    def test_nested_braces(self, tmp_path: Path):
         lines = [
             "int foo(int x) {",  # 0
             "    if (x) {",
@@ -158,22 +394,135 @@ class TestFindFunctionEnd:
             "    return 0;",
             "}",  # 5
         ]
-        assert BitcodeGenerator._find_function_end(lines, 0) == 5
+        assert self._end(tmp_path, lines) == 5
 
-    def test_brace_in_comment_ignored(self):
+    def test_brace_in_comment_ignored(self, tmp_path: Path):
         lines = [
             "void f() {",  # 0
             "    // { not counted",
             "    return;",
             "}",  # 3
         ]
-        assert BitcodeGenerator._find_function_end(lines, 0) == 3
+        assert self._end(tmp_path, lines) == 3
 
-    def test_function_signature_on_separate_line(self):
+    def test_function_signature_on_separate_line(self, tmp_path: Path):
         lines = [
             "void f()",  # 0
             "{",  # 1
             "    return;",
             "}",  # 3
         ]
-        assert BitcodeGenerator._find_function_end(lines, 0) == 3
+        assert self._end(tmp_path, lines) == 3
+
+    def test_braces_in_literals_and_block_comments_ignored(self, tmp_path: Path):
+        lines = [
+            "void f() {",  # 0
+            '    puts("}\\" {");',
+            "    char c = '}';",
+            "    /* }",
+            "       } */",
+            "}",  # 5
+        ]
+        assert self._end(tmp_path, lines) == 5
+
+    def test_long_function(self, tmp_path: Path):
+        lines = ["void f() {", *(["    x++;"] * 500), "}"]
+        assert self._end(tmp_path, lines) == 501
+
+    def test_unclosed_falls_back_to_start(self, tmp_path: Path):
+        lines = ["void f() {", *(["    x++;"] * 2500), "}"]
+        assert self._end(tmp_path, lines) == 0
+
+    def test_escaped_backslash_closes_literal(self, tmp_path: Path):
+        lines = [
+            "void f() {",  # 0
+            "    s = \"\\\\\"; t = '\\\\';",
+            "    if (x) { y(); }",
+            "}",  # 3
+        ]
+        assert self._end(tmp_path, lines) == 3
+
+
+class TestGenerate:
+    def test_function_metas_cached_by_bitcode(self, tmp_path: Path, monkeypatch):
+        from z_code_analyzer.models.build import BuildCommand
+
+        def generate(bc: bytes):
+            # Every build writes to a fresh output dir
+            out_dir = Path(tempfile.mkdtemp(dir=tmp_path))
+            (out_dir / "library.bc").write_bytes(bc)
+            (out_dir / "library.ll").write_text(SAMPLE_LL_RENAMED)
+            out = BitcodeGenerator().generate(
+                "/src/proj", BuildCommand([], "user", "custom"), [], output_dir=str(out_dir)
+            )
+            return [(m.ir_name, m.file_path, m.line) for m in out.function_metas]
+
+        parses = []
+        real_parse = BitcodeGenerator._parse_ll_debug_info
+
+        def parse(*args, **kwargs):
+            parses.append(args[0])
+            return real_parse(*args, **kwargs)
+
+        monkeypatch.setattr(BitcodeGenerator, "_parse_ll_debug_info", staticmethod(parse))
+
+        assert generate(b"BC-1") == [("init.1", "lib/a.c", 5)]
+        assert generate(b"BC-1") == [("init.1", "lib/a.c", 5)]
+        assert len(parses) == 1
+
+        # New bitcode: re-parsed; past the limit the least recently used goes
+        monkeypatch.setattr(bitcode, "_METAS_CACHE_MAX_FILES", 2)
+        assert generate(b"BC-2") == [("init.1", "lib/a.c", 5)]
+        assert len(parses) == 2
+        cached = sorted(bitcode.METAS_CACHE_DIR.glob("function_metas.*.pickle"))
+        for i, path in enumerate(cached):
+            os.utime(path, (i + 1, i + 1))
+        newest = cached[-1]
+        generate(b"BC-3")
+        remaining = set(bitcode.METAS_CACHE_DIR.glob("function_metas.*.pickle"))
+        assert len(remaining) == 2 and newest in remaining
+
+
+class TestGenerateViaDocker:
+    @staticmethod
+    def _run(tmp_path: Path, monkeypatch, script: str):
+        """Run generate_via_docker with the container replaced by *script*."""
+        import subprocess
+        import sys
+
+        real_popen = subprocess.Popen
+        commands = []
+
+        def popen(cmd, **kw):
+            commands.append(cmd)
+            return real_popen([sys.executable, "-c", script], **kw)
+
+        monkeypatch.setattr(bitcode.subprocess, "Popen", popen)
+        case_config = tmp_path / "proj.sh"
+        case_config.write_text("PROJECT_NAME=proj\n")
+        result = BitcodeGenerator().generate_via_docker(
+            str(tmp_path), str(case_config), [], str(tmp_path)
+        )
+        return result, commands
+
+    def test_failure_reports_log_tail(self, tmp_path: Path, monkeypatch):
+        from z_code_analyzer.exceptions import BitcodeError
+
+        script = "print('=== start'); print('x' * 100000); print('boom: link failed'); exit(2)"
+        with pytest.raises(BitcodeError, match="rc=2") as exc:
+            self._run(tmp_path, monkeypatch, script)
+        assert "boom: link failed" in str(exc.value)
+        assert "=== start" not in str(exc.value)
+        assert (tmp_path / "build.log").read_text().startswith("=== start\n")
+
+    def test_ll_parsed_after_pipeline(self, tmp_path: Path, monkeypatch):
+        (tmp_path / "library.bc").write_bytes(b"BC")
+        (tmp_path / "library.ll").write_text(SAMPLE_LL_RENAMED)
+        script = "print('=== [5/6] Disassembling to .ll ==='); print('=== [6/6] Copying ===')"
+
+        result, (cmd,) = self._run(tmp_path, monkeypatch, script)
+        assert [m.ir_name for m in result.function_metas] == ["init.1"]
+
+        # Toolchain download caches persist across containers
+        mounts = {cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-v"}
+        assert "z-code-analyzer-apt-cache:/var/cache/apt/archives" in mounts
@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
+import z_code_analyzer
 from z_code_analyzer.cli import (
     _WORK_ORDER_TEMPLATE,
     _parse_neo4j_auth,
@@ -259,3 +263,21 @@ class TestQueryCommands:
             )
             assert result.exit_code != 0
             assert "No snapshot found" in result.output
+
+
+# ── Package import ──
+
+
+class TestLazyPackageImport:
+    def test_import_does_not_load_heavy_modules(self):
+        code = (
+            "import sys, z_code_analyzer; "
+            "assert 'sqlalchemy' not in sys.modules and 'neo4j' not in sys.modules; "
+            "from z_code_analyzer import CodeAnalyzer, CallType; "
+            "assert CodeAnalyzer.__module__ == 'z_code_analyzer.api'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            z_code_analyzer.NoSuchThing  # noqa: B018
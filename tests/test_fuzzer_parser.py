@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 
+from z_code_analyzer.build import fuzzer_parser
 from z_code_analyzer.build.fuzzer_parser import FuzzerEntryParser
 
 # Sample fuzzer source
@@ -111,6 +113,33 @@ class TestFuzzerEntryParser:
         assert result["fuzz_a"] == ["lib_a"]
         assert result["fuzz_b"] == ["lib_b"]
 
+    def test_shared_sources_parsed_once(self, tmp_path: Path, monkeypatch):
+        (tmp_path / "fuzz.c").write_text(FUZZER_WITH_HELPER)
+        (tmp_path / "extra.c").write_text("void unused(void) { lib_x(); }")
+        parser = FuzzerEntryParser()
+        parsed = []
+        real_extract = parser._extract_functions_and_calls
+        monkeypatch.setattr(
+            parser,
+            "_extract_functions_and_calls",
+            lambda content: parsed.append(content) or real_extract(content),
+        )
+
+        result = parser.parse(
+            fuzzer_sources={
+                "fuzz_a": ["fuzz.c"],
+                "fuzz_b": ["fuzz.c"],
+                "fuzz_c": ["fuzz.c", "extra.c"],
+            },
+            library_functions={"lib_create_context", "lib_set_data", "lib_run", "lib_x"},
+            project_path=str(tmp_path),
+        )
+
+        expected = ["lib_create_context", "lib_run", "lib_set_data"]
+        assert result == {"fuzz_a": expected, "fuzz_b": expected, "fuzz_c": expected}
+        assert result["fuzz_a"] is not result["fuzz_b"]
+        assert len(parsed) == 2
+
     def test_missing_source_file(self, tmp_path: Path):
         parser = FuzzerEntryParser()
         result = parser.parse(
@@ -132,3 +161,58 @@ class TestFuzzerEntryParser:
         )
         # No LLVMFuzzerTestOneInput found, so no calls expanded
         assert result["fuzz1"] == []
+
+    def test_regex_fallback_skips_braces_in_comments_and_literals(self):
+        source = (
+            "static void helper(void) {\n"
+            '    log_msg("} \\" {"); /* } */\n'
+            "    // }\n"
+            "    char c = '}';\n"
+            "    lib_a();\n"
+            "}\n"
+            "int LLVMFuzzerTestOneInput(const uint8_t *data, size_t size) {\n"
+            "    lib_b(data, size);\n"
+            "    return 0;\n"
+            "}\n"
+        )
+        names, calls = FuzzerEntryParser()._extract_with_regex(source)
+        assert names == ["helper", "LLVMFuzzerTestOneInput"]
+        assert calls == [{"log_msg", "lib_a"}, {"lib_b"}]
+
+    def test_tree_walk_credits_calls_to_enclosing_functions(self, monkeypatch):
+        def node(kind, *children, text=b"", **fields):
+            return SimpleNamespace(
+                type=kind,
+                children=[*fields.values(), *children],
+                text=text,
+                child_by_field_name=fields.get,
+            )
+
+        def func(name, *body):
+            ident = node("identifier", text=name)
+            return node("function_definition", *body, declarator=node("function_declarator", ident))
+
+        def call(name, *args):
+            return node("call_expression", *args, function=node("identifier", text=name))
+
+        # outer() { a(b()); inner() { c(); } }  helper() { d(); }
+        root = node(
+            "translation_unit",
+            func(b"outer", call(b"a", call(b"b")), func(b"inner", call(b"c"))),
+            func(b"helper", call(b"d")),
+        )
+        parser = SimpleNamespace(parse=lambda source: SimpleNamespace(root_node=root))
+        monkeypatch.setattr(fuzzer_parser, "_c_parser", lambda: parser)
+
+        names, calls = FuzzerEntryParser()._extract_with_tree_sitter(b"")
+        assert names == ["outer", "inner", "helper"]
+        assert calls == [{"a", "b", "c"}, {"c"}, {"d"}]
+
+    def test_regex_fallback_return_type_on_own_line(self):
+        # A long run of bare words (e.g. a comment without punctuation) used
+        # to make definition matching quadratic
+        source = "/*\n" + "lorem ipsum dolor sit amet\n" * 20000 + "*/\n"
+        source += "static int\nhelper(const uint8_t *data)\n{\n    lib_a(data);\n}\n"
+        names, calls = FuzzerEntryParser()._extract_with_regex(source)
+        assert names == ["helper"]
+        assert calls == [{"lib_a"}]
@@ -13,7 +13,7 @@ import pytest
 
 from z_code_analyzer.backends.base import CallEdge, CallType, FunctionRecord, FuzzerInfo
 from z_code_analyzer.exceptions import AmbiguousFunctionError
-from z_code_analyzer.graph_store import GraphStore
+from z_code_analyzer.graph_store import GraphStore, _batches
 
 NEO4J_URI = os.environ.get("NEO4J_URI", "bolt://localhost:7687")
 # Default: no auth (matches docker-compose.yml NEO4J_AUTH=none)
@@ -148,6 +148,18 @@ def _populate(store: GraphStore, sid: str):
 # ── Write + Read Tests ──
 
 
+class TestBatches:
+    def test_batches_consume_lazily(self):
+        assert list(_batches(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(_batches([], 2)) == []
+
+    def test_empty_lists_skip_the_session(self):
+        # No driver: opening a session would fail
+        store = GraphStore()
+        assert store.import_functions("sid", []) == 0
+        assert store.import_edges("sid", []) == 0
+
+
 @needs_neo4j
 class TestWriteAndQuery:
     def test_import_functions(self, store: GraphStore, snapshot_id: str):
@@ -161,6 +173,11 @@ class TestWriteAndQuery:
         count = store.import_edges(snapshot_id, _make_edges())
         assert count == 4
 
+    def test_import_from_generators(self, store: GraphStore, snapshot_id: str):
+        store.create_snapshot_node(snapshot_id, "https://github.com/t/r", "v1", "svf")
+        assert store.import_functions(snapshot_id, iter(_make_functions())) == 5
+        assert store.import_edges(snapshot_id, (e for e in _make_edges())) == 4
+
     def test_get_function_metadata(self, store: GraphStore, snapshot_id: str):
         _populate(store, snapshot_id)
         meta = store.get_function_metadata(snapshot_id, "main_func")
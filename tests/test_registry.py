@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from z_code_analyzer.backends.base import AnalysisResult, FunctionRecord
+from z_code_analyzer.backends.base import AnalysisResult, CallEdge, CallType, FunctionRecord
+from z_code_analyzer.backends.edge_table import EdgeTable
 from z_code_analyzer.backends.merger import ResultMerger
 from z_code_analyzer.backends.registry import (
     BackendCapability,
@@ -87,6 +88,50 @@ class TestBackendRegistry:
         assert "c" in svf.supported_languages
         assert "cpp" in svf.supported_languages
 
+    def test_find_by_language_cache_invalidated_on_register(self):
+        registry = create_default_registry()
+        assert [d.name for d in registry.find_by_language("c")] == ["svf"]
+        registry.register(
+            BackendDescriptor(
+                name="better",
+                supported_languages={"c"},
+                capabilities=set(),
+                precision_score=0.99,
+                speed_score=0.5,
+                prerequisites=[],
+                factory=SVFBackend,
+            )
+        )
+        assert [d.name for d in registry.find_by_language("c")] == ["better", "svf"]
+
+    def test_find_best_backend_cached(self):
+        calls = []
+
+        class _Backend:
+            def check_prerequisites(self, project_path):
+                calls.append(project_path)
+                return []
+
+        registry = BackendRegistry()
+        registry.register(
+            BackendDescriptor(
+                name="fake",
+                supported_languages={"c"},
+                capabilities=set(),
+                precision_score=0.5,
+                speed_score=0.5,
+                prerequisites=[],
+                factory=_Backend,
+            )
+        )
+        first = registry.find_best_backend("c", "/p1")
+        assert registry.find_best_backend("c", "/p2") is first
+        assert calls == ["/p1"]
+
+        registry.invalidate()
+        assert registry.find_best_backend("c", "/p3") is not first
+        assert calls == ["/p1", "/p3"]
+
 
 class TestResultMerger:
     def test_single_result_passthrough(self):
@@ -110,3 +155,167 @@ class TestResultMerger:
 
         with pytest.raises(ValueError):
             merger.merge([])
+
+    def test_multi_result_unions_edges(self):
+        svf = AnalysisResult(
+            functions=[],
+            edges=[
+                CallEdge(caller="a", callee="b", source_backend="svf"),
+                CallEdge(caller="a", callee="c", call_type=CallType.FPTR, source_backend="svf"),
+            ],
+            language="c",
+            backend="svf",
+        )
+        joern = AnalysisResult(
+            functions=[],
+            edges=[
+                CallEdge(caller="a", callee="b", confidence=0.5, source_backend="joern"),
+                CallEdge(caller="b", callee="d", source_backend="joern"),
+            ],
+            language="c",
+            backend="joern",
+        )
+        merged = ResultMerger.merge([svf, joern])
+        assert merged.backend == "svf+joern"
+        assert [(e.caller, e.callee, e.source_backend) for e in merged.edges] == [
+            ("a", "b", "svf"),
+            ("a", "c", "svf"),
+            ("b", "d", "joern"),
+        ]
+
+    def test_multi_result_prefers_higher_confidence(self):
+        low = AnalysisResult(
+            functions=[
+                FunctionRecord(
+                    name="f",
+                    file_path="a.c",
+                    start_line=1,
+                    end_line=2,
+                    content="",
+                    language="c",
+                    confidence=0.4,
+                )
+            ],
+            edges=[CallEdge(caller="a", callee="b", confidence=0.4, source_backend="svf")],
+            language="c",
+            backend="svf",
+        )
+        high = AnalysisResult(
+            functions=[
+                FunctionRecord(
+                    name="f",
+                    file_path="a.c",
+                    start_line=1,
+                    end_line=3,
+                    content="",
+                    language="c",
+                    confidence=0.9,
+                ),
+                FunctionRecord(
+                    name="f", file_path="b.c", start_line=1, end_line=2, content="", language="c"
+                ),
+            ],
+            edges=[CallEdge(caller="a", callee="b", confidence=0.9, source_backend="joern")],
+            language="c",
+            backend="joern",
+        )
+        merged = ResultMerger.merge([low, high])
+        assert [e.source_backend for e in merged.edges] == ["joern"]
+        assert [(f.file_path, f.end_line) for f in merged.functions] == [("a.c", 3), ("b.c", 2)]
+
+    def test_multi_result_concatenates_warnings(self):
+        results = [
+            AnalysisResult(
+                functions=[], edges=[], language="c", backend=f"b{i}", warnings=[f"w{i}"]
+            )
+            for i in range(3)
+        ]
+        merged = ResultMerger.merge(results)
+        assert merged.warnings == ["w0", "w1", "w2"]
+        assert results[0].warnings == ["w0"]
+
+    def test_numba_matches_pure_python(self, monkeypatch):
+        import importlib
+
+        import pytest
+
+        from z_code_analyzer.backends import merger
+
+        pytest.importorskip("numba")
+        # Re-import under its real name so numba's on-disk cache stays loadable
+        monkeypatch.setenv("ZVS_USE_NUMBA", "1")
+        importlib.reload(merger)
+        try:
+            assert merger._USE_NUMBA
+            # Repeated pairs with higher, lower and equal confidence
+            names = [f"f{i}" for i in range(7)]
+            edges = [
+                CallEdge(
+                    caller=names[i % 7],
+                    callee=names[(i * 3) % 5],
+                    confidence=(i % 3) / 2,
+                    source_backend=f"b{i % 3}",
+                )
+                for i in range(200)
+            ]
+            table = EdgeTable.from_edges(edges)
+            assert merger._best_edge_rows(table) == merger._best_edge_rows_py(
+                table.caller_ids, table.callee_ids, table.confidence
+            )
+        finally:
+            monkeypatch.delenv("ZVS_USE_NUMBA")
+            importlib.reload(merger)
+
+
+class TestEdgeTable:
+    def test_round_trip(self):
+        edges = [
+            CallEdge(
+                caller="main",
+                callee="parse",
+                call_type=CallType.FPTR,
+                call_site_file="src/main.c",
+                call_site_line=42,
+                caller_file="src/main.c",
+                callee_file="src/parse.c",
+                confidence=0.9,
+                source_backend="svf",
+            ),
+            CallEdge(caller="parse", callee="main"),
+        ]
+        table = EdgeTable.from_edges(edges)
+        assert len(table) == 2
+        assert table.to_edges() == edges
+
+    def test_strings_are_pooled(self):
+        table = EdgeTable.from_edges(
+            [
+                CallEdge(caller="a", callee="b", caller_file="x.c", callee_file="x.c"),
+                CallEdge(caller="b", callee="a", caller_file="x.c", callee_file="x.c"),
+            ]
+        )
+        assert table.caller_ids[0] == table.callee_ids[1]
+        assert table.caller_file_ids[0] == table.callee_file_ids[1]
+        assert table.name_pool.count("x.c") == 1
+
+    def test_call_type_round_trips_as_member(self):
+        table = EdgeTable.from_edges([CallEdge(caller="a", callee="b", call_type=CallType.FPTR)])
+        assert table.call_type[0] == CallType.FPTR == 1
+        assert table.row(0).call_type is CallType.FPTR
+        assert table.row(0).call_type.label == "fptr"
+
+
+class TestRecords:
+    def test_edge_strings_interned(self):
+        a = CallEdge(caller="".join(["ma", "in"]), callee="f", caller_file="".join(["x", ".c"]))
+        b = CallEdge(caller="".join(["mai", "n"]), callee="f", caller_file="".join(["x.", "c"]))
+        assert a.caller is b.caller
+        assert a.caller_file is b.caller_file
+
+    def test_records_have_no_instance_dict(self):
+        f = FunctionRecord(
+            name="f", file_path="x.c", start_line=1, end_line=2, content="", language="c"
+        )
+        e = CallEdge(caller="f", callee="g")
+        assert not hasattr(f, "__dict__")
+        assert not hasattr(e, "__dict__")
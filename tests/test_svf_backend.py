@@ -6,15 +6,24 @@ Integration tests require Docker + svftools/svf image.
 
 from __future__ import annotations
 
+import io
 import os
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
 
 import pytest
 
-from z_code_analyzer.backends.svf_backend import SVFBackend
+from z_code_analyzer.backends.base import CallType
+from z_code_analyzer.backends.svf_backend import SVFBackend, _index_metas, _tail
 from z_code_analyzer.svf.svf_dot_parser import (
     get_all_function_names,
     get_edge_list,
     get_typed_edge_list,
+    iter_typed_edges,
     parse_svf_dot,
 )
 
@@ -92,10 +101,17 @@ class TestSVFDotParser:
         nodes, adj = parse_svf_dot(dot)
         assert "foo" not in adj.get("foo", set())
 
+    def test_names_are_interned(self):
+        nodes, adj = parse_svf_dot(SAMPLE_DOT)
+        assert all(name is sys.intern("".join(name)) for name in nodes.values())
+        callee = next(iter(adj["main"]))
+        assert callee is sys.intern(callee)
+
     def test_get_all_function_names(self):
         nodes, _ = parse_svf_dot(SAMPLE_DOT)
         names = get_all_function_names(nodes)
         assert len(names) == 5
+        assert names == list(dict.fromkeys(nodes.values()))
 
     def test_get_edge_list(self):
         _, adj = parse_svf_dot(SAMPLE_DOT)
@@ -104,6 +120,9 @@ class TestSVFDotParser:
         assert ("main", "png_read_data") in edges
         assert ("png_read_data", "user_read_data") in edges
 
+    def test_parse_from_line_iterable(self):
+        assert parse_svf_dot(io.StringIO(SAMPLE_DOT)) == parse_svf_dot(SAMPLE_DOT)
+
     def test_empty_dot(self):
         nodes, adj = parse_svf_dot("")
         assert len(nodes) == 0
@@ -128,6 +147,13 @@ class TestSVFDotParser:
         # png_read_data -> malloc is in both (direct)
         assert type_map[("png_read_data", "malloc")] == "direct"
 
+    def test_iter_typed_edges_is_lazy(self):
+        _, initial_adj = parse_svf_dot(SAMPLE_INITIAL_DOT)
+        _, final_adj = parse_svf_dot(SAMPLE_DOT)
+        it = iter_typed_edges(initial_adj, final_adj)
+        assert iter(it) is it
+        assert list(it) == get_typed_edge_list(initial_adj, final_adj)
+
     def test_typed_edge_list_all_direct_when_same(self):
         """When initial == final, all edges should be direct."""
         _, adj = parse_svf_dot(SAMPLE_DOT)
@@ -158,6 +184,407 @@ class TestSVFBackend:
         with pytest.raises(SVFError, match="not found"):
             backend.analyze("/tmp", "c", bc_path="/nonexistent/library.bc")
 
+    def test_check_prerequisites_remembers_success(self, monkeypatch):
+        from z_code_analyzer.backends import svf_backend
+
+        monkeypatch.setattr(svf_backend, "_prerequisites_ok", set())
+        calls: list[list[str]] = []
+        returncode = 1
+
+        def _run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, returncode)
+
+        monkeypatch.setattr(svf_backend.subprocess, "run", _run)
+        backend = SVFBackend()
+
+        assert backend.check_prerequisites("/tmp")  # failure is not cached
+        returncode = 0
+        assert backend.check_prerequisites("/tmp") == []
+        assert len(calls) == 4
+        assert SVFBackend().check_prerequisites("/tmp") == []
+        assert len(calls) == 4
+
+        SVFBackend.clear_prerequisites_cache()
+        assert backend.check_prerequisites("/tmp") == []
+        assert len(calls) == 6
+
+    def test_log_tail(self):
+        log = io.BytesIO(b"x" * 100 + "end \u2713".encode())
+        assert _tail(log, 7) == "end \u2713"
+        assert _tail(log, 1000).startswith("xxx")
+
+    def test_analyze_without_initial_dot_marks_all_direct(self, tmp_path):
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+        final = tmp_path / "callgraph_final.dot"
+        final.write_text(SAMPLE_DOT)
+        backend = SVFBackend()
+
+        @contextmanager
+        def _dot_files(bc_path, cache_key):
+            yield partial(open, final), None
+
+        backend._dot_files = _dot_files
+        result = backend.analyze("/tmp", "c", bc_path=str(bc))
+        assert result.metadata["edge_count"] == len(result.edges) == 5
+        assert result.metadata["fptr_edge_count"] == 0
+        assert all(e.call_type is CallType.DIRECT for e in result.edges)
+
+    def test_index_metas_by_ir_and_original_name(self):
+        foo = {"ir_name": "_Z3foov", "original_name": "foo"}
+        bar = {"ir_name": "bar", "original_name": "bar"}
+        anon = {"ir_name": "", "original_name": ""}
+        index = _index_metas([foo, bar, anon])
+        assert list(index) == ["_Z3foov", "foo", "bar"]
+        assert index["foo"] is index["_Z3foov"]
+        assert index["foo"]["ir_name"] == "_Z3foov"
+        # missing fields are filled in once, without touching the input
+        assert index["bar"]["file_path"] == "" and index["bar"]["line"] == 0
+        assert "file_path" not in bar
+        full = {"ir_name": "baz", "file_path": "b.c", "line": 1, "end_line": 2, "content": ""}
+        assert _index_metas([full])["baz"] is full
+
+
+class TestSVFCache:
+    """DOT output cache — Docker calls are stubbed on the instance."""
+
+    def _backend(self, tmp_path, calls, returncode=0):
+        backend = SVFBackend(cache_dir=tmp_path / "cache")
+        backend._image_id = lambda: "sha256:img"
+
+        @contextmanager
+        def _run(bc_path):
+            calls.append(bc_path)
+            out = Path(tempfile.mkdtemp(dir=tmp_path))
+            (out / "callgraph_final.dot").write_text(SAMPLE_DOT)
+            (out / "callgraph_initial.dot").write_text(SAMPLE_INITIAL_DOT)
+            yield (
+                partial(open, out / "callgraph_final.dot"),
+                partial(open, out / "callgraph_initial.dot"),
+                returncode,
+            )
+
+        backend._run_svf_docker = _run
+        return backend
+
+    def test_second_run_hits_cache(self, tmp_path):
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC\xc0\xde")
+        calls: list[str] = []
+        backend = self._backend(tmp_path, calls)
+
+        first = backend.analyze("/tmp", "c", bc_path=str(bc))
+        second = backend.analyze("/tmp", "c", bc_path=str(bc))
+
+        assert len(calls) == 1
+        assert second.edges == first.edges
+        assert second.metadata["fptr_edge_count"] == 1
+
+    def test_hit_skips_dot_parse(self, tmp_path):
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC\xc0\xde")
+        calls: list[str] = []
+        backend = self._backend(tmp_path, calls)
+
+        first = backend.analyze("/tmp", "c", bc_path=str(bc))
+        (entry,) = (tmp_path / "cache").iterdir()
+        assert (entry / "graph.v1.pickle").exists()
+        for dot in entry.glob("*.dot.gz"):
+            dot.unlink()
+
+        second = backend.analyze("/tmp", "c", bc_path=str(bc))
+        assert len(calls) == 1
+        assert second.edges == first.edges
+        assert second.functions == first.functions
+
+    def test_analyze_many(self, tmp_path):
+        bcs = []
+        for name in ("liba.bc", "libb.bc"):
+            bc = tmp_path / name
+            bc.write_bytes(name.encode())
+            bcs.append(str(bc))
+        calls: list[str] = []
+        backend = self._backend(tmp_path, calls)
+        metas = {bcs[1]: [{"ir_name": "main", "file_path": "b.c", "line": 1}]}
+
+        result = backend.analyze_many("/tmp", "c", bcs, function_metas_by_bc=metas)
+
+        assert sorted(calls) == sorted(bcs)
+        assert result.metadata["node_count"] == 10
+        assert result.metadata["fptr_edge_count"] == 2
+        assert result.metadata["bc_paths"] == bcs
+        mains = [f for f in result.functions if f.name == "main"]
+        assert [f.file_path for f in mains] == ["", "b.c"]
+
+    def test_changed_bitcode_misses(self, tmp_path):
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"v1")
+        calls: list[str] = []
+        backend = self._backend(tmp_path, calls)
+
+        backend.analyze("/tmp", "c", bc_path=str(bc))
+        bc.write_bytes(b"v2")
+        backend.analyze("/tmp", "c", bc_path=str(bc))
+        assert len(calls) == 2
+
+    def test_flags_are_part_of_key(self, tmp_path):
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"v1")
+        backend = SVFBackend(cache_dir=tmp_path)
+        backend._image_id = lambda: "sha256:img"
+        other = SVFBackend(cache_dir=tmp_path, svf_flags=["-ander"])
+        other._image_id = lambda: "sha256:img"
+        assert backend._cache_key(str(bc)) != other._cache_key(str(bc))
+
+    def test_failed_run_not_cached(self, tmp_path):
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"v1")
+        calls: list[str] = []
+        backend = self._backend(tmp_path, calls, returncode=137)
+
+        first = backend.analyze("/tmp", "c", bc_path=str(bc))
+        backend.analyze("/tmp", "c", bc_path=str(bc))
+        assert len(calls) == 2
+        assert first.metadata["node_count"] == 5  # the output is still used
+        assert not (tmp_path / "cache").exists()
+
+    def test_least_recently_used_entries_evicted(self, tmp_path, monkeypatch):
+        from z_code_analyzer.backends import svf_backend
+
+        bcs = []
+        for name in ("a.bc", "b.bc", "c.bc"):
+            bc = tmp_path / name
+            bc.write_bytes(name.encode())
+            bcs.append(str(bc))
+        calls: list[str] = []
+        backend = self._backend(tmp_path, calls)
+        backend.analyze("/tmp", "c", bc_path=bcs[0])
+        (entry,) = (tmp_path / "cache").iterdir()
+        entry_size = sum(f.stat().st_size for f in entry.iterdir())
+        monkeypatch.setattr(svf_backend, "SVF_CACHE_MAX_BYTES", 2 * entry_size)
+
+        os.utime(entry, (1, 1))
+        backend.analyze("/tmp", "c", bc_path=bcs[1])
+        os.utime(tmp_path / "cache" / backend._cache_key(bcs[1]), (2, 2))
+        backend.analyze("/tmp", "c", bc_path=bcs[0])  # hit: now the newest
+        backend.analyze("/tmp", "c", bc_path=bcs[2])
+
+        kept = {p.name for p in (tmp_path / "cache").iterdir()}
+        assert kept == {backend._cache_key(bcs[0]), backend._cache_key(bcs[2])}
+        assert len(calls) == 3
+
+    def test_use_cache_false_bypasses(self, tmp_path):
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"v1")
+        calls: list[str] = []
+        backend = self._backend(tmp_path, calls)
+
+        backend.analyze("/tmp", "c", bc_path=str(bc))
+        backend.analyze("/tmp", "c", bc_path=str(bc), use_cache=False)
+        assert len(calls) == 2
+
+
+class TestSVFWorker:
+    """Warm worker container — docker CLI calls are faked."""
+
+    @pytest.fixture
+    def docker_calls(self, tmp_path, monkeypatch):
+        from z_code_analyzer.backends import svf_backend
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(svf_backend, "_workers", {})
+        tmpfs: dict[str, str] = {}  # the container's /output
+        calls: list[list[str]] = []
+
+        def _run(cmd, **kwargs):
+            calls.append(cmd)
+            stdout = ""
+            if cmd[1] == "exec" and cmd[2] == "--workdir":
+                out_dir = cmd[3]
+                tmpfs[f"{out_dir}/callgraph_final.dot"] = SAMPLE_DOT
+                tmpfs[f"{out_dir}/callgraph_initial.dot"] = SAMPLE_INITIAL_DOT
+            elif cmd[1] == "exec" and cmd[3] == "ls":
+                prefix = cmd[-1] + "/"
+                stdout = "\n".join(k.removeprefix(prefix) for k in tmpfs if k.startswith(prefix))
+            elif cmd[1] == "exec" and cmd[3] == "rm":
+                for k in [k for k in tmpfs if k.startswith(cmd[-1] + "/")]:
+                    del tmpfs[k]
+            return subprocess.CompletedProcess(cmd, 0, stdout, "")
+
+        class _Popen:
+            def __init__(self, cmd, **kwargs):
+                calls.append(cmd)
+                self.stdout = io.StringIO(tmpfs[cmd[-1]])
+                self.returncode = 0
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        monkeypatch.setattr(svf_backend.subprocess, "run", _run)
+        monkeypatch.setattr(svf_backend.subprocess, "Popen", _Popen)
+        yield calls, tmpfs
+        for worker in svf_backend._workers.values():
+            worker.stop()
+
+    def test_worker_started_once_and_reused(self, tmp_path, docker_calls):
+        calls, tmpfs = docker_calls
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+
+        for _ in range(2):
+            with SVFBackend()._run_svf_docker(str(bc)) as (final, initial, _):
+                with final() as f:
+                    assert f.read() == SAMPLE_DOT
+                with initial() as f:
+                    assert f.read() == SAMPLE_INITIAL_DOT
+
+        assert [c[1] for c in calls].count("run") == 1
+        assert "sleep" in calls[0]
+        assert any(a.startswith("/output:") for a in calls[0])
+        assert tmpfs == {}  # each run's tmpfs dir is removed
+
+    def test_resource_limits(self, tmp_path, docker_calls):
+        calls, _ = docker_calls
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+
+        with SVFBackend()._run_svf_docker(str(bc)):
+            pass
+        with SVFBackend(cpu_limit=8, mem_limit="16g")._run_svf_docker(str(bc)):
+            pass
+
+        runs = [c for c in calls if c[1] == "run"]
+        assert len(runs) == 2  # different limits, different worker
+        assert "--cpus" not in runs[0] and "--memory" not in runs[0]
+        assert runs[1][runs[1].index("--cpus") + 1] == "8"
+        assert runs[1][runs[1].index("--memory") + 1] == "16g"
+        assert runs[1][-3:] == ["svftools/svf", "sleep", "infinity"]
+
+    def test_wpa_flags(self, tmp_path, docker_calls):
+        calls, _ = docker_calls
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+
+        with SVFBackend()._run_svf_docker(str(bc)):
+            pass
+        with SVFBackend(svf_flags=["-ander", "-print-fp"])._run_svf_docker(str(bc)):
+            pass
+
+        wpa = [c[c.index("wpa") + 1 :] for c in calls if "wpa" in c]
+        assert wpa[0][:4] == ["-ander", "-node-alloc-strat=dense", "-stat=false", "-dump-callgraph"]
+        assert wpa[1][:3] == ["-ander", "-print-fp", "-dump-callgraph"]
+
+    def test_timeout_drops_worker(self, tmp_path, docker_calls, monkeypatch):
+        from z_code_analyzer.backends import svf_backend
+        from z_code_analyzer.exceptions import SVFError
+
+        calls, _ = docker_calls
+        real_run = svf_backend.subprocess.run
+
+        def _run(cmd, **kwargs):
+            if cmd[1:3] == ["exec", "--workdir"]:
+                raise subprocess.TimeoutExpired(cmd, 1)
+            return real_run(cmd, **kwargs)
+
+        monkeypatch.setattr(svf_backend.subprocess, "run", _run)
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+
+        with pytest.raises(SVFError, match="timed out"):
+            with SVFBackend()._run_svf_docker(str(bc)):
+                pass
+        assert calls[-1][:3] == ["docker", "rm", "-f"]
+        assert all(w.container is None for w in svf_backend._workers.values())
+
+    @staticmethod
+    def _kill_containers(monkeypatch, dead: set[str]):
+        """Make execs into containers in *dead* fail as Docker reports a vanished one."""
+        from z_code_analyzer.backends import svf_backend
+
+        real_run = svf_backend.subprocess.run
+
+        def _run(cmd, **kwargs):
+            if cmd[1] == "exec":
+                name = cmd[4] if cmd[2] == "--workdir" else cmd[2]
+                if name in dead:
+                    err = f"Error response from daemon: No such container: {name}"
+                    if hasattr(kwargs.get("stderr"), "write"):
+                        kwargs["stderr"].write(err.encode())
+                    return subprocess.CompletedProcess(cmd, 1, "", err)
+            return real_run(cmd, **kwargs)
+
+        monkeypatch.setattr(svf_backend.subprocess, "run", _run)
+
+    def test_vanished_container_is_restarted(self, tmp_path, docker_calls, monkeypatch):
+        from z_code_analyzer.backends import svf_backend
+
+        calls, _ = docker_calls
+        dead: set[str] = set()
+        self._kill_containers(monkeypatch, dead)
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+
+        with SVFBackend()._run_svf_docker(str(bc)):
+            pass
+        (worker,) = svf_backend._workers.values()
+        dead.add(worker.container)
+
+        with SVFBackend()._run_svf_docker(str(bc)) as (final, _, _):
+            with final() as f:
+                assert f.read() == SAMPLE_DOT
+        assert [c[1] for c in calls].count("run") == 2
+        assert worker.container not in dead
+
+    def test_container_lost_during_wpa_is_rerun(self, tmp_path, docker_calls, monkeypatch):
+        from z_code_analyzer.backends import svf_backend
+
+        calls, _ = docker_calls
+        dead: set[str] = set()
+        self._kill_containers(monkeypatch, dead)
+        wrapped = svf_backend.subprocess.run
+        wpa_containers: list[str] = []
+
+        def _run(cmd, **kwargs):
+            if cmd[1:3] == ["exec", "--workdir"]:
+                wpa_containers.append(cmd[4])
+                if not dead:
+                    dead.add(cmd[4])  # dies under the first wpa
+            return wrapped(cmd, **kwargs)
+
+        monkeypatch.setattr(svf_backend.subprocess, "run", _run)
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+
+        with SVFBackend()._run_svf_docker(str(bc)) as (final, _, _):
+            with final() as f:
+                assert f.read() == SAMPLE_DOT
+        assert len(wpa_containers) == 2
+        assert wpa_containers[0] != wpa_containers[1]
+        assert [c[1] for c in calls].count("run") == 2
+
+    def test_failed_staging_exec_raises(self, tmp_path, docker_calls, monkeypatch):
+        from z_code_analyzer.backends import svf_backend
+        from z_code_analyzer.exceptions import SVFError
+
+        real_run = svf_backend.subprocess.run
+
+        def _run(cmd, **kwargs):
+            if cmd[1] == "exec" and cmd[3] == "mkdir":
+                return subprocess.CompletedProcess(cmd, 1, "", "mkdir: No space left on device")
+            return real_run(cmd, **kwargs)
+
+        monkeypatch.setattr(svf_backend.subprocess, "run", _run)
+        bc = tmp_path / "library.bc"
+        bc.write_bytes(b"BC")
+
+        with pytest.raises(SVFError, match="No space left on device"):
+            with SVFBackend()._run_svf_docker(str(bc)):
+                pass
+
 
 @needs_docker
 class TestSVFBackendIntegration:
@@ -220,6 +220,9 @@ def app():
         yield mock_session
 
     application.dependency_overrides[deps.get_session] = _mock_session
+    application.dependency_overrides[deps.get_session_factory] = lambda: MagicMock(
+        return_value=mock_session
+    )
 
     # Override auth dependency — return a fake user by default
     async def _mock_user():
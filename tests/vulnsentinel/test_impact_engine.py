@@ -287,6 +287,25 @@ class TestListPublishedWithoutImpact:
         results = await uv_dao.list_published_without_impact(session, limit=1)
         assert len(results) == 1
 
+    @pytest.mark.anyio()
+    async def test_after_cursor_pages(
+        self, uv_dao, session, published_vuln, event2, library, dep_a
+    ):
+        vuln2 = await uv_dao.create(
+            session,
+            event_id=event2.id,
+            library_id=library.id,
+            commit_sha="def456",
+        )
+        await uv_dao.publish(session, vuln2.id)
+
+        first = await uv_dao.list_published_without_impact(session, limit=1)
+        rest = await uv_dao.list_published_without_impact(
+            session, limit=1, after=(first[0].published_at, first[0].id)
+        )
+        assert len(rest) == 1
+        assert {first[0].id, rest[0].id} == {published_vuln.id, vuln2.id}
+
 
 # ── TestImpactRunner (mock-based, no DB) ─────────────────────────────────────
 
@@ -71,3 +71,39 @@ class TestGetDashboard:
         assert result["libraries_count"] == 0
         assert result["vuln_recorded"] == 0
         assert result["vuln_fixed"] == 0
+
+    async def test_get_dashboard_with_session_factory(self):
+        service, project_dao, library_dao, cv_service = _make_service()
+        project_dao.count = AsyncMock(return_value=3)
+        library_dao.count = AsyncMock(return_value=7)
+        cv_service.get_stats = AsyncMock(
+            return_value={
+                "total_recorded": 5,
+                "total_reported": 4,
+                "total_confirmed": 2,
+                "total_fixed": 1,
+            }
+        )
+
+        sessions = []
+
+        def _factory():
+            sess = AsyncMock()
+            sess.__aenter__ = AsyncMock(return_value=sess)
+            sess.__aexit__ = AsyncMock(return_value=False)
+            sessions.append(sess)
+            return sess
+
+        shared = AsyncMock()
+        result = await service.get_dashboard(shared, _factory)
+
+        assert result["projects_count"] == 3
+        assert result["libraries_count"] == 7
+        assert result["vuln_recorded"] == 5
+        assert result["vuln_fixed"] == 1
+        assert "percent" in result["disk"]
+        # Each query gets its own session; the request session is untouched.
+        assert len(sessions) == 3
+        project_dao.count.assert_awaited_once_with(sessions[0])
+        library_dao.count.assert_awaited_once_with(sessions[1])
+        cv_service.get_stats.assert_awaited_once_with(sessions[2])
@@ -155,6 +155,48 @@ class TestListPaginated:
         assert ids1.isdisjoint(ids2)
 
 
+# ── list_paginated_with_total ─────────────────────────────────────────────
+
+
+class TestListPaginatedWithTotal:
+    async def test_empty(self, dao, session):
+        page = await dao.list_paginated_with_total(session)
+        assert page.data == []
+        assert page.total == 0
+
+    async def test_filter_by_library(self, dao, session, event, event_lib2, library, library2):
+        await dao.create(session, **_vuln(event.id, library.id))
+        await dao.create(session, **_vuln(event_lib2.id, library2.id, "xyz789"))
+
+        page = await dao.list_paginated_with_total(session, library_id=library.id)
+        assert len(page.data) == 1
+        assert page.data[0].library_id == library.id
+        assert page.total == 1
+
+    async def test_total_ignores_cursor(self, dao, session, library, ev_dao):
+        base_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            ev = await ev_dao.create(
+                session,
+                library_id=library.id,
+                type="commit",
+                ref=f"pgtotal_{i}",
+                title=f"fix #{i}",
+            )
+            vuln = await dao.create(session, **_vuln(ev.id, library.id, f"sha_{i}"))
+            vuln.created_at = base_time + timedelta(minutes=i)
+            await session.flush()
+
+        page1 = await dao.list_paginated_with_total(session, page_size=3)
+        assert len(page1.data) == 3
+        assert page1.total == 5
+
+        page2 = await dao.list_paginated_with_total(session, cursor=page1.next_cursor, page_size=3)
+        assert len(page2.data) == 2
+        assert page2.has_more is False
+        assert page2.total == 5
+
+
 # ── count ─────────────────────────────────────────────────────────────────
 
 
@@ -173,6 +215,13 @@ class TestCount:
     async def test_count_empty(self, dao, session):
         assert await dao.count(session) == 0
 
+    async def test_estimate_count(self, dao, session, event, library):
+        # reltuples depends on autovacuum timing; only the contract is stable.
+        await dao.create(session, **_vuln(event.id, library.id, "s1"))
+        estimate = await dao.estimate_count(session)
+        assert isinstance(estimate, int)
+        assert estimate >= 0
+
 
 # ── list_by_event ─────────────────────────────────────────────────────────
 
@@ -250,6 +299,64 @@ class TestUpdateAnalysis:
             )
 
 
+class TestUpdateAnalysisMany:
+    async def test_updates_each_row(self, dao, session, event, library):
+        v1 = await dao.create(session, **_vuln(event.id, library.id, "s1"))
+        v2 = await dao.create(session, **_vuln(event.id, library.id, "s2"))
+        await dao.update_analysis_many(
+            session,
+            [
+                {
+                    "id": v1.id,
+                    "vuln_type": "buffer_overflow",
+                    "severity": "high",
+                    "affected_versions": "<1.0",
+                    "summary": "s1",
+                    "reasoning": "r1",
+                    "upstream_poc": {"type": "input"},
+                },
+                {
+                    "id": v2.id,
+                    "vuln_type": "use_after_free",
+                    "severity": "low",
+                    "affected_versions": "<2.0",
+                    "summary": "s2",
+                    "reasoning": "r2",
+                },
+            ],
+        )
+        await session.refresh(v1)
+        await session.refresh(v2)
+
+        assert (v1.vuln_type, v1.severity, v1.upstream_poc) == (
+            "buffer_overflow",
+            "high",
+            {"type": "input"},
+        )
+        assert (v2.vuln_type, v2.severity, v2.upstream_poc) == ("use_after_free", "low", None)
+
+    async def test_missing_optional_keeps_value(self, dao, session, event, library):
+        vuln = await dao.create(session, **_vuln(event.id, library.id))
+        fields = {
+            "vuln_type": "x",
+            "severity": "low",
+            "affected_versions": "x",
+            "summary": "x",
+            "reasoning": "x",
+        }
+        await dao.update_analysis(session, vuln.id, **fields, affected_functions=["f"])
+        await dao.update_analysis_many(session, [{"id": vuln.id, **fields}])
+        await session.refresh(vuln)
+        assert vuln.affected_functions == ["f"]
+
+    async def test_empty_is_noop(self, dao, session):
+        await dao.update_analysis_many(session, [])
+
+    async def test_none_pk_raises(self, dao, session):
+        with pytest.raises(ValueError, match="pk must not be None"):
+            await dao.update_analysis_many(session, [{"id": None}])
+
+
 # ── publish ───────────────────────────────────────────────────────────────
 
 
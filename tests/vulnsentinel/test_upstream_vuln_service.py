@@ -132,16 +132,33 @@ class TestList:
 
         service, uv_dao, _ = _make_service()
         uv_dao.list_paginated = AsyncMock(return_value=page)
-        uv_dao.count = AsyncMock(return_value=50)
+        uv_dao.count = AsyncMock()
+        uv_dao.estimate_count = AsyncMock()
 
         session = AsyncMock()
         result = await service.list(session, page_size=2)
 
         assert result["data"] == vulns
-        assert result["total"] == 50
+        assert result["total"] is None
         assert result["has_more"] is True
         uv_dao.list_paginated.assert_awaited_once_with(session, None, 2, library_id=None)
-        uv_dao.count.assert_awaited_once_with(session, library_id=None)
+        uv_dao.count.assert_not_awaited()
+        uv_dao.estimate_count.assert_not_awaited()
+
+    async def test_list_all_with_total_uses_estimate(self):
+        page = Page(data=[_make_upstream_vuln()], next_cursor=None, has_more=False)
+
+        service, uv_dao, _ = _make_service()
+        uv_dao.list_paginated = AsyncMock(return_value=page)
+        uv_dao.count = AsyncMock()
+        uv_dao.estimate_count = AsyncMock(return_value=1234)
+
+        session = AsyncMock()
+        result = await service.list(session, include_total=True)
+
+        assert result["total"] == 1234
+        uv_dao.estimate_count.assert_awaited_once_with(session)
+        uv_dao.count.assert_not_awaited()
 
     async def test_list_by_library(self):
         lib_id = uuid.uuid4()
@@ -149,13 +166,26 @@ class TestList:
 
         service, uv_dao, _ = _make_service()
         uv_dao.list_paginated = AsyncMock(return_value=page)
-        uv_dao.count = AsyncMock(return_value=1)
 
         session = AsyncMock()
         result = await service.list(session, library_id=lib_id)
 
         uv_dao.list_paginated.assert_awaited_once_with(session, None, 20, library_id=lib_id)
-        uv_dao.count.assert_awaited_once_with(session, library_id=lib_id)
+        assert result["total"] is None
+
+    async def test_list_by_library_with_total(self):
+        lib_id = uuid.uuid4()
+        page = Page(data=[_make_upstream_vuln()], next_cursor=None, has_more=False, total=1)
+
+        service, uv_dao, _ = _make_service()
+        uv_dao.list_paginated_with_total = AsyncMock(return_value=page)
+
+        session = AsyncMock()
+        result = await service.list(session, library_id=lib_id, include_total=True)
+
+        uv_dao.list_paginated_with_total.assert_awaited_once_with(
+            session, None, 20, library_id=lib_id
+        )
         assert result["total"] == 1
 
     async def test_list_empty(self):
@@ -163,12 +193,11 @@ class TestList:
 
         service, uv_dao, _ = _make_service()
         uv_dao.list_paginated = AsyncMock(return_value=page)
-        uv_dao.count = AsyncMock(return_value=0)
 
         result = await service.list(AsyncMock())
 
         assert result["data"] == []
-        assert result["total"] == 0
+        assert result["has_more"] is False
 
 
 # ---------------------------------------------------------------------------
@@ -273,6 +302,19 @@ class TestUpdateAnalysis:
         assert kwargs["upstream_poc"] == poc
         assert kwargs["severity"] == "critical"
 
+    async def test_update_analysis_many_forwards(self):
+        service, uv_dao, _ = _make_service()
+        uv_dao.update_analysis_many = AsyncMock()
+
+        session = AsyncMock()
+        updates = [
+            {"id": uuid.uuid4(), "severity": "low"},
+            {"id": uuid.uuid4(), "severity": "high"},
+        ]
+        await service.update_analysis_many(session, updates)
+
+        uv_dao.update_analysis_many.assert_awaited_once_with(session, updates)
+
 
 # ---------------------------------------------------------------------------
 # publish
@@ -306,3 +348,34 @@ class TestSetError:
         await service.set_error(session, pk, "LLM timeout after 30s")
 
         uv_dao.set_error.assert_awaited_once_with(session, pk, "LLM timeout after 30s")
+
+
+# ---------------------------------------------------------------------------
+# iter_published_without_impact
+# ---------------------------------------------------------------------------
+
+
+class TestIterPublishedWithoutImpact:
+    async def test_pages_with_keyset_cursor(self):
+        service, uv_dao, _ = _make_service()
+        now = datetime.now(timezone.utc)
+        vulns = [_make_upstream_vuln(status="published", published_at=now) for _ in range(3)]
+        uv_dao.list_published_without_impact = AsyncMock(side_effect=[vulns[:2], vulns[2:]])
+
+        session = AsyncMock()
+        seen = [v async for v in service.iter_published_without_impact(session, batch_size=2)]
+
+        assert seen == vulns
+        calls = uv_dao.list_published_without_impact.await_args_list
+        assert calls[0].kwargs["after"] is None
+        assert calls[1].kwargs["after"] == (now, vulns[1].id)
+
+    async def test_full_last_page_ends_on_empty(self):
+        service, uv_dao, _ = _make_service()
+        vulns = [_make_upstream_vuln(status="published") for _ in range(2)]
+        uv_dao.list_published_without_impact = AsyncMock(side_effect=[vulns, []])
+
+        seen = [v async for v in service.iter_published_without_impact(AsyncMock(), batch_size=2)]
+
+        assert seen == vulns
+        assert uv_dao.list_published_without_impact.await_count == 2
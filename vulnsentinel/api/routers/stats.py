@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from vulnsentinel.api.deps import get_current_user, get_session, get_stats_service
+from vulnsentinel.api.deps import (
+    get_current_user,
+    get_session,
+    get_session_factory,
+    get_stats_service,
+)
 from vulnsentinel.api.schemas.stats import DashboardResponse
 from vulnsentinel.models.user import User
 from vulnsentinel.services.stats_service import StatsService
@@ -17,7 +22,8 @@ router = APIRouter()
 async def get_dashboard(
     session: AsyncSession = Depends(get_session),
     _user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
     svc: StatsService = Depends(get_stats_service),
 ) -> DashboardResponse:
-    result = await svc.get_dashboard(session)
+    result = await svc.get_dashboard(session, session_factory)
     return DashboardResponse(**result)
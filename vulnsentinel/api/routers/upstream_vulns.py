@@ -29,11 +29,18 @@ async def list_upstream_vulns(
     cursor: str | None = Query(None),
     page_size: int = Query(20, ge=1, le=100),
     library_id: uuid.UUID | None = Query(None),
+    include_total: bool = Query(False),
     session: AsyncSession = Depends(get_session),
     _user: User = Depends(get_current_user),
     svc: UpstreamVulnService = Depends(get_upstream_vuln_service),
 ) -> PaginatedResponse[UpstreamVulnListItem]:
-    result = await svc.list(session, cursor=cursor, page_size=page_size, library_id=library_id)
+    result = await svc.list(
+        session,
+        cursor=cursor,
+        page_size=page_size,
+        library_id=library_id,
+        include_total=include_total,
+    )
     return PaginatedResponse(
         data=[UpstreamVulnListItem.model_validate(v) for v in result["data"]],
         meta=PageMeta(
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy import BigInteger, Select, cast, column, func, select, table, tuple_
 from sqlalchemy import exists as sa_exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -191,6 +191,32 @@ class BaseDAO(Generic[ModelT]):
 
     # ── Core methods ─────────────────────────────────────────────────────
 
+    def _apply_cursor(self, query: Select, cursor: str | None, page_size: int) -> Select:
+        """Append the keyset predicate, ordering, and ``LIMIT page_size + 1``."""
+        table = self.model.__table__
+
+        if cursor:
+            cur = decode_cursor(cursor)
+            query = query.where(tuple_(table.c.created_at, table.c.id) < (cur.created_at, cur.id))
+
+        return query.order_by(
+            table.c.created_at.desc(),
+            table.c.id.desc(),
+        ).limit(page_size + 1)
+
+    @staticmethod
+    def _build_page(rows: list[ModelT], page_size: int, total: int | None = None) -> Page[ModelT]:
+        """Trim the look-ahead row and encode the next cursor."""
+        has_more = len(rows) > page_size
+        data = rows[:page_size]
+
+        next_cursor = None
+        if has_more and data:
+            last = data[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return Page(data=data, next_cursor=next_cursor, has_more=has_more, total=total)
+
     async def paginate(
         self,
         session: AsyncSession,
@@ -207,29 +233,46 @@ class BaseDAO(Generic[ModelT]):
         Raises ``InvalidCursorError`` if *cursor* is malformed.
         """
         page_size = _clamp_page_size(page_size)
-        table = self.model.__table__
-
-        if cursor:
-            cur = decode_cursor(cursor)
-            query = query.where(tuple_(table.c.created_at, table.c.id) < (cur.created_at, cur.id))
-
-        query = query.order_by(
-            table.c.created_at.desc(),
-            table.c.id.desc(),
-        ).limit(page_size + 1)
+        query = self._apply_cursor(query, cursor, page_size)
 
         result = await session.execute(query)
         rows = list(result.scalars().all())
+        return self._build_page(rows, page_size)
 
-        has_more = len(rows) > page_size
-        data = rows[:page_size]
+    async def paginate_with_total(
+        self,
+        session: AsyncSession,
+        query: Select,
+        cursor: str | None = None,
+        page_size: int = PAGE_SIZE_DEFAULT,
+    ) -> Page[ModelT]:
+        """Like :meth:`paginate`, but also fill ``Page.total`` in the same query.
 
-        next_cursor = None
-        if has_more and data:
-            last = data[-1]
-            next_cursor = encode_cursor(last.created_at, last.id)
+        The total row count of *query* (ignoring the cursor) is attached to
+        every row as a scalar subquery, so the page and its total come back
+        in a single round trip. Only an empty page past the first one needs
+        a separate ``COUNT(*)``.
 
-        return Page(data=data, next_cursor=next_cursor, has_more=has_more)
+        Raises ``InvalidCursorError`` if *cursor* is malformed.
+        """
+        page_size = _clamp_page_size(page_size)
+        total_col = (
+            select(func.count()).select_from(query.subquery()).scalar_subquery().label("total")
+        )
+        paged = self._apply_cursor(query.add_columns(total_col), cursor, page_size)
+
+        result = await session.execute(paged)
+        pairs = result.all()
+
+        if pairs:
+            total = pairs[0][1]
+        elif cursor:
+            # Subclasses may override count() with a filter-based signature.
+            total = await BaseDAO.count(self, session, query)
+        else:
+            total = 0
+
+        return self._build_page([row[0] for row in pairs], page_size, total=total)
 
     async def count(self, session: AsyncSession, query: Select | None = None) -> int:
         """Return the row count for *query*, or total rows if query is None."""
@@ -240,3 +283,20 @@ class BaseDAO(Generic[ModelT]):
 
         result = await session.execute(query)
         return result.scalar_one()
+
+    async def estimate_count(self, session: AsyncSession) -> int:
+        """Return the planner's row estimate for the whole table.
+
+        Reads ``pg_class.reltuples`` (maintained by VACUUM / ANALYZE) — O(1)
+        regardless of table size. Falls back to an exact :meth:`count` when
+        the table has never been analyzed.
+        """
+        pg_class = table("pg_class", column("oid"), column("reltuples"))
+        stmt = select(cast(pg_class.c.reltuples, BigInteger)).where(
+            pg_class.c.oid == func.to_regclass(self.model.__tablename__)
+        )
+        result = await session.execute(stmt)
+        estimate = result.scalar_one_or_none()
+        if estimate is None or estimate < 0:
+            return await BaseDAO.count(self, session)
+        return estimate
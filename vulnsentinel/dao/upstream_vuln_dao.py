@@ -1,9 +1,11 @@
 """UpstreamVulnDAO — upstream_vulns table operations."""
 
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select, update
+from sqlalchemy import cast, column, func, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vulnsentinel.dao.base import BaseDAO, Page
@@ -11,6 +13,19 @@ from vulnsentinel.models.client_vuln import ClientVuln
 from vulnsentinel.models.project_dependency import ProjectDependency
 from vulnsentinel.models.upstream_vuln import UpstreamVuln
 
+# Columns written by update_analysis / update_analysis_many, in VALUES order.
+_ANALYSIS_COLUMNS = (
+    "id",
+    "vuln_type",
+    "severity",
+    "affected_versions",
+    "summary",
+    "reasoning",
+    "upstream_poc",
+    "affected_functions",
+)
+_OPTIONAL_ANALYSIS_COLUMNS = frozenset({"upstream_poc", "affected_functions"})
+
 
 class UpstreamVulnDAO(BaseDAO[UpstreamVuln]):
     model = UpstreamVuln
@@ -30,6 +45,19 @@ class UpstreamVulnDAO(BaseDAO[UpstreamVuln]):
             query = query.where(UpstreamVuln.library_id == library_id)
         return await self.paginate(session, query, cursor, page_size)
 
+    async def list_paginated_with_total(
+        self,
+        session: AsyncSession,
+        cursor: str | None = None,
+        page_size: int = 20,
+        library_id: uuid.UUID | None = None,
+    ) -> Page[UpstreamVuln]:
+        """Paginated vuln list with ``total`` filled in one round trip (API)."""
+        query = select(UpstreamVuln)
+        if library_id is not None:
+            query = query.where(UpstreamVuln.library_id == library_id)
+        return await self.paginate_with_total(session, query, cursor, page_size)
+
     async def count(
         self,
         session: AsyncSession,
@@ -52,14 +80,19 @@ class UpstreamVulnDAO(BaseDAO[UpstreamVuln]):
         self,
         session: AsyncSession,
         limit: int = 20,
+        after: tuple[datetime, uuid.UUID] | None = None,
     ) -> list[UpstreamVuln]:
         """Published vulns that have no client_vulns yet and whose library has dependents.
 
         Used by ImpactEngine to find vulns needing impact assessment.
+        Ordered by ``(published_at, id)``; pass the last row's pair as
+        *after* to fetch the next page.
         """
+        stmt = select(UpstreamVuln)
+        if after is not None:
+            stmt = stmt.where(tuple_(UpstreamVuln.published_at, UpstreamVuln.id) > after)
         stmt = (
-            select(UpstreamVuln)
-            .where(
+            stmt.where(
                 UpstreamVuln.status == "published",
                 ~select(ClientVuln.id)
                 .where(ClientVuln.upstream_vuln_id == UpstreamVuln.id)
@@ -70,7 +103,7 @@ class UpstreamVulnDAO(BaseDAO[UpstreamVuln]):
                 .correlate(UpstreamVuln)
                 .exists(),
             )
-            .order_by(UpstreamVuln.published_at.asc())
+            .order_by(UpstreamVuln.published_at.asc(), UpstreamVuln.id.asc())
             .limit(limit)
         )
         result = await session.execute(stmt)
@@ -108,6 +141,43 @@ class UpstreamVulnDAO(BaseDAO[UpstreamVuln]):
         stmt = update(UpstreamVuln).where(UpstreamVuln.id == pk).values(**values)
         await session.execute(stmt)
 
+    async def update_analysis_many(
+        self, session: AsyncSession, updates: list[dict[str, Any]]
+    ) -> None:
+        """Write analysis results for many vulns in one ``UPDATE ... FROM (VALUES ...)``.
+
+        Each dict carries ``id`` plus the keyword arguments of
+        :meth:`update_analysis`; ``upstream_poc`` / ``affected_functions``
+        that are missing or None keep their current value.
+        """
+        if not updates:
+            return
+        for u in updates:
+            self._require_pk(u.get("id"))
+
+        table_cols = UpstreamVuln.__table__.c
+        # none_as_null: a missing optional must bind SQL NULL (so COALESCE
+        # keeps the old value), not the JSON literal 'null'.
+        v = values(
+            *(
+                column(name, JSONB(none_as_null=True))
+                if name in _OPTIONAL_ANALYSIS_COLUMNS
+                else column(name, table_cols[name].type)
+                for name in _ANALYSIS_COLUMNS
+            ),
+            name="v",
+        ).data([tuple(u.get(name) for name in _ANALYSIS_COLUMNS) for u in updates])
+
+        assignments: dict[str, Any] = {}
+        for name in _ANALYSIS_COLUMNS[1:]:
+            if name in _OPTIONAL_ANALYSIS_COLUMNS:
+                # An all-NULL VALUES column is typed text; cast it back.
+                assignments[name] = func.coalesce(cast(v.c[name], JSONB), table_cols[name])
+            else:
+                assignments[name] = v.c[name]
+        stmt = update(UpstreamVuln).where(UpstreamVuln.id == v.c.id).values(**assignments)
+        await session.execute(stmt)
+
     async def publish(self, session: AsyncSession, pk: uuid.UUID) -> None:
         """Publish a vuln: status → 'published', published_at → now()."""
         self._require_pk(pk)
@@ -43,7 +43,7 @@ class VulnAnalyzerRunner:
 
         A single event may contain multiple independent vulnerability fixes.
         For each vulnerability found:
-          create (flush) → update_analysis → publish.
+          create (flush) → update_analysis_many → publish.
 
         On analysis failure: create a placeholder vuln, set_error, re-raise.
         The placeholder prevents ``list_bugfix_without_vuln`` from
@@ -73,7 +73,8 @@ class VulnAnalyzerRunner:
             raise
 
         # First result reuses the placeholder; additional results get new records.
-        for i, result in enumerate(results):
+        vulns = []
+        for i in range(len(results)):
             if i == 0:
                 vuln = placeholder
             else:
@@ -84,18 +85,26 @@ class VulnAnalyzerRunner:
                     commit_sha=event.ref,
                 )
                 await session.flush()
+            vulns.append(vuln)
 
-            await self._vuln_service.update_analysis(
-                session,
-                vuln.id,
-                vuln_type=result.vuln_type,
-                severity=result.severity,
-                affected_versions=result.affected_versions,
-                summary=result.summary,
-                reasoning=result.reasoning,
-                upstream_poc=result.upstream_poc,
-                affected_functions=result.affected_functions,
-            )
+        # One UPDATE for all results instead of one round trip each.
+        await self._vuln_service.update_analysis_many(
+            session,
+            [
+                {
+                    "id": vuln.id,
+                    "vuln_type": result.vuln_type,
+                    "severity": result.severity,
+                    "affected_versions": result.affected_versions,
+                    "summary": result.summary,
+                    "reasoning": result.reasoning,
+                    "upstream_poc": result.upstream_poc,
+                    "affected_functions": result.affected_functions,
+                }
+                for vuln, result in zip(vulns, results, strict=True)
+            ],
+        )
+        for vuln in vulns:
             await self._vuln_service.publish(session, vuln.id)
 
         return results
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -41,10 +42,25 @@ class UpstreamVulnService:
         cursor: str | None = None,
         page_size: int = 20,
         library_id: uuid.UUID | None = None,
+        include_total: bool = False,
     ) -> dict:
-        """Return paginated upstream vuln list, optionally filtered by library."""
-        page = await self._uv_dao.list_paginated(session, cursor, page_size, library_id=library_id)
-        total = await self._uv_dao.count(session, library_id=library_id)
+        """Return keyset-paginated upstream vuln list, optionally filtered by library.
+
+        ``total`` is ``None`` unless *include_total* is set — clients page on
+        ``has_more``. When requested, a library-filtered list gets an exact
+        count in the same round trip as the page; the unfiltered list gets
+        the planner's row estimate instead of a full-table ``COUNT(*)``.
+        """
+        if include_total and library_id is not None:
+            page = await self._uv_dao.list_paginated_with_total(
+                session, cursor, page_size, library_id=library_id
+            )
+            total = page.total
+        else:
+            page = await self._uv_dao.list_paginated(
+                session, cursor, page_size, library_id=library_id
+            )
+            total = await self._uv_dao.estimate_count(session) if include_total else None
         return {
             "data": page.data,
             "next_cursor": page.next_cursor,
@@ -101,6 +117,15 @@ class UpstreamVulnService:
             affected_functions=affected_functions,
         )
 
+    async def update_analysis_many(
+        self, session: AsyncSession, updates: list[dict[str, Any]]
+    ) -> None:
+        """Write LLM analysis results for several vulns in one statement.
+
+        Each dict holds ``id`` plus the keyword arguments of :meth:`update_analysis`.
+        """
+        await self._uv_dao.update_analysis_many(session, updates)
+
     async def publish(self, session: AsyncSession, vuln_id: uuid.UUID) -> None:
         """Publish a vuln: status → 'published', published_at → now().
 
@@ -115,6 +140,21 @@ class UpstreamVulnService:
         """Published vulns needing impact assessment (passthrough to DAO)."""
         return await self._uv_dao.list_published_without_impact(session, limit)
 
+    async def iter_published_without_impact(
+        self, session: AsyncSession, batch_size: int = 20
+    ) -> AsyncIterator[UpstreamVuln]:
+        """Yield published vulns needing impact assessment, one keyset page at a time."""
+        after = None
+        while True:
+            page = await self._uv_dao.list_published_without_impact(
+                session, batch_size, after=after
+            )
+            for vuln in page:
+                yield vuln
+            if len(page) < batch_size:
+                return
+            after = (page[-1].published_at, page[-1].id)
+
     async def set_error(
         self, session: AsyncSession, vuln_id: uuid.UUID, error_message: str
     ) -> None:
@@ -1,26 +1,53 @@
 """Z-Code-Analyzer-Station: Multi-backend static analysis engine."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from z_code_analyzer.api import (
-    CodeAnalyzer,
-    SeedTreeRequest,
-    SeedTreeResult,
-    SnapshotRequest,
-    VulnImpactRequest,
-    VulnImpactResult,
-)
-from z_code_analyzer.backends.base import (
-    AnalysisBackend,
-    AnalysisResult,
-    CallEdge,
-    CallType,
-    FunctionRecord,
-)
-from z_code_analyzer.graph_store import GraphStore
-from z_code_analyzer.orchestrator import StaticAnalysisOrchestrator
-from z_code_analyzer.reachability import ReachabilityChecker, ReachabilityResult
-from z_code_analyzer.snapshot_manager import SnapshotManager
+if TYPE_CHECKING:
+    from z_code_analyzer.api import (
+        CodeAnalyzer,
+        SeedTreeRequest,
+        SeedTreeResult,
+        SnapshotRequest,
+        VulnImpactRequest,
+        VulnImpactResult,
+    )
+    from z_code_analyzer.backends.base import (
+        AnalysisBackend,
+        AnalysisResult,
+        CallEdge,
+        CallType,
+        FunctionRecord,
+    )
+    from z_code_analyzer.graph_store import GraphStore
+    from z_code_analyzer.orchestrator import StaticAnalysisOrchestrator
+    from z_code_analyzer.reachability import ReachabilityChecker, ReachabilityResult
+    from z_code_analyzer.snapshot_manager import SnapshotManager
+
+# Public name → defining module. Imported on first attribute access (PEP 562)
+# so that e.g. ``z-analyze --version`` does not pull in SQLAlchemy and neo4j.
+_LAZY_ATTRS = {
+    "AnalysisBackend": "z_code_analyzer.backends.base",
+    "AnalysisResult": "z_code_analyzer.backends.base",
+    "CallEdge": "z_code_analyzer.backends.base",
+    "CallType": "z_code_analyzer.backends.base",
+    "CodeAnalyzer": "z_code_analyzer.api",
+    "FunctionRecord": "z_code_analyzer.backends.base",
+    "GraphStore": "z_code_analyzer.graph_store",
+    "ReachabilityChecker": "z_code_analyzer.reachability",
+    "ReachabilityResult": "z_code_analyzer.reachability",
+    "SeedTreeRequest": "z_code_analyzer.api",
+    "SeedTreeResult": "z_code_analyzer.api",
+    "SnapshotManager": "z_code_analyzer.snapshot_manager",
+    "SnapshotRequest": "z_code_analyzer.api",
+    "StaticAnalysisOrchestrator": "z_code_analyzer.orchestrator",
+    "VulnImpactRequest": "z_code_analyzer.api",
+    "VulnImpactResult": "z_code_analyzer.api",
+}
 
 __all__ = [
     "AnalysisBackend",
@@ -40,3 +67,16 @@ __all__ = [
     "VulnImpactRequest",
     "VulnImpactResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
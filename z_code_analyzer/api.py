@@ -10,11 +10,16 @@ Scenarios:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
+import re
 import shutil
+import signal
 import subprocess
 import tempfile
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -112,6 +117,8 @@ class CodeAnalyzer:
         result = await analyzer.investigate_vuln(VulnImpactRequest(...))
     """
 
+    _SNAPSHOT_CACHE_SIZE = 256
+
     def __init__(
         self,
         snapshot_manager: SnapshotManager,
@@ -132,6 +139,13 @@ class CodeAnalyzer:
             graph_store=graph_store,
             snapshot_manager=snapshot_manager,
         )
+        # Single-flight registry: (repo_url, version) → result of the
+        # in-progress _ensure_snapshot call for that key (None if it was cancelled).
+        self._inflight: dict[
+            tuple[str, str], asyncio.Future[tuple[str | None, str | None] | None]
+        ] = {}
+        # LRU of (repo_url, version) → snapshot id for snapshots known to exist.
+        self._snap_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
 
     # ── Scenario 1 & 2: snapshot analysis ────────────────────────────────
 
@@ -174,8 +188,9 @@ class CodeAnalyzer:
 
         Steps:
             1. ``_ensure_snapshot()`` for the client repo.
-            2. ``_ensure_snapshot()`` for the library repo.
-            3. ``ReachabilityChecker.check()`` — both snapshots now exist.
+            2. ``_ensure_snapshot()`` for the library repo (concurrently with 1).
+            3. ``ReachabilityChecker.check()``; if a snapshot turns out to
+               have been evicted meanwhile, rebuild it and check once more.
 
         """
         if not request.affected_functions:
@@ -185,11 +200,20 @@ class CodeAnalyzer:
                 error="no_affected_functions",
             )
 
-        # 1. Ensure client snapshot
-        client_sid, client_err = await self._ensure_snapshot(
-            request.client_repo_url,
-            request.client_version,
-            project_path=request.client_project_path,
+        # 1+2. Ensure both snapshots concurrently (independent repos). Cache
+        # lookups and waits on other workers' builds overlap; errors are
+        # inspected only after both have finished.
+        (client_sid, client_err), (library_sid, library_err) = await asyncio.gather(
+            self._ensure_snapshot(
+                request.client_repo_url,
+                request.client_version,
+                project_path=request.client_project_path,
+            ),
+            self._ensure_snapshot(
+                request.library_repo_url,
+                request.library_version,
+                project_path=request.library_project_path,
+            ),
         )
         if client_err:
             return VulnImpactResult(
@@ -197,13 +221,6 @@ class CodeAnalyzer:
                 searched_functions=request.affected_functions,
                 error=f"client_snapshot_build_failed: {client_err}",
             )
-
-        # 2. Ensure library snapshot
-        library_sid, library_err = await self._ensure_snapshot(
-            request.library_repo_url,
-            request.library_version,
-            project_path=request.library_project_path,
-        )
         if library_err:
             return VulnImpactResult(
                 is_reachable=False,
@@ -212,18 +229,50 @@ class CodeAnalyzer:
                 error=f"library_snapshot_build_failed: {library_err}",
             )
 
-        # 3. Run reachability check — snapshots are guaranteed to exist
+        # 3. Run reachability check. A snapshot id served from _snap_cache
+        # may have been evicted since (TTL, version limit, disk pressure):
+        # forget it, rebuild that side and check once more.
         vuln_dict = {
             "affected_functions": request.affected_functions,
             "commit_sha": request.commit_sha,
         }
-        rr: ReachabilityResult = await self._checker.check(
-            client_repo_url=request.client_repo_url,
-            client_version=request.client_version,
-            library_repo_url=request.library_repo_url,
-            library_version=request.library_version,
-            vuln=vuln_dict,
-        )
+        sides = {
+            "client_snapshot_not_found": (
+                "client",
+                request.client_repo_url,
+                request.client_version,
+                request.client_project_path,
+            ),
+            "library_snapshot_not_found": (
+                "library",
+                request.library_repo_url,
+                request.library_version,
+                request.library_project_path,
+            ),
+        }
+        for attempt in range(2):
+            rr: ReachabilityResult = await self._checker.check(
+                client_repo_url=request.client_repo_url,
+                client_version=request.client_version,
+                library_repo_url=request.library_repo_url,
+                library_version=request.library_version,
+                vuln=vuln_dict,
+            )
+            if rr.error not in sides:
+                break
+            side, repo_url, version, project_path = sides[rr.error]
+            self.invalidate_snapshot(repo_url, version)
+            if attempt:
+                break
+            logger.info("Snapshot %s@%s vanished; rebuilding", repo_url, version)
+            _, err = await self._ensure_snapshot(repo_url, version, project_path=project_path)
+            if err:
+                return VulnImpactResult(
+                    is_reachable=False,
+                    searched_functions=request.affected_functions,
+                    client_snapshot_id=client_sid if side == "library" else None,
+                    error=f"{side}_snapshot_build_failed: {err}",
+                )
         return VulnImpactResult(
             is_reachable=rr.is_reachable,
             searched_functions=rr.searched_functions,
@@ -235,6 +284,20 @@ class CodeAnalyzer:
             error=rr.error,
         )
 
+    def invalidate_snapshot(self, repo_url: str, version: str) -> None:
+        """Forget the cached snapshot id for ``(repo_url, version)``.
+
+        Call after deleting that snapshot so the next request rebuilds it.
+        """
+        self._snap_cache.pop((repo_url, version), None)
+
+    def _remember_snapshot(self, repo_url: str, version: str, snapshot_id: str) -> None:
+        key = (repo_url, version)
+        self._snap_cache[key] = snapshot_id
+        self._snap_cache.move_to_end(key)
+        if len(self._snap_cache) > self._SNAPSHOT_CACHE_SIZE:
+            self._snap_cache.popitem(last=False)
+
     # ── Scenario 4: seed tree generation (stub) ──────────────────────────
 
     async def generate_seed_tree(self, request: SeedTreeRequest) -> SeedTreeResult:
@@ -254,13 +317,63 @@ class CodeAnalyzer:
     ) -> tuple[str | None, str | None]:
         """Find an existing snapshot or build one.
 
+        Concurrent calls for the same ``(repo_url, version)`` are coalesced:
+        only the first does the work, the rest await its result. If that
+        first call is cancelled, one of the waiters takes over the build.
+
         Returns ``(snapshot_id, None)`` on success,
-        or ``(None, error_message)`` on failure.
+        or ``(None, error_message)`` on failure; only cancellation propagates.
         """
+        key = (repo_url, version)
+        while True:
+            # No await between lookup and insert, so no lock is needed.
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            logger.info("Joining in-flight snapshot build: %s@%s", repo_url, version)
+            result = await asyncio.shield(pending)
+            if result is not None:
+                return result
+            # None: the building call was cancelled; retry (the first waiter
+            # to get here becomes the new builder)
+
+        fut: asyncio.Future[tuple[str | None, str | None] | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = fut
+        try:
+            try:
+                result = await self._find_or_build_snapshot(repo_url, version, project_path)
+            except Exception as exc:
+                logger.exception("Snapshot lookup/build failed: %s@%s", repo_url, version)
+                result = (None, str(exc))
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+            if not fut.done():
+                # Cancelled (that propagates): wake the waiters to retry
+                fut.set_result(None)
+
+    async def _find_or_build_snapshot(
+        self,
+        repo_url: str,
+        version: str,
+        project_path: str | None,
+    ) -> tuple[str | None, str | None]:
+        """Uncoalesced body of :meth:`_ensure_snapshot`."""
+        # Fastest path: snapshot id already known in this process
+        key = (repo_url, version)
+        cached = self._snap_cache.get(key)
+        if cached is not None:
+            self._snap_cache.move_to_end(key)
+            return cached, None
+
         # Fast path: snapshot already exists
         snap = await asyncio.to_thread(self._sm.find_snapshot, repo_url, version)
         if snap is not None:
             logger.info("Snapshot cache hit: %s@%s → %s", repo_url, version, snap.id)
+            self._remember_snapshot(repo_url, version, str(snap.id))
             return str(snap.id), None
 
         # Slow path: build the snapshot
@@ -274,6 +387,7 @@ class CodeAnalyzer:
                     fuzzer_sources={},
                 )
             )
+            self._remember_snapshot(repo_url, version, output.snapshot_id)
             return output.snapshot_id, None
         except Exception as exc:
             logger.warning(
@@ -288,44 +402,99 @@ class CodeAnalyzer:
 
 # ── Utility: auto-clone ──────────────────────────────────────────────────
 
+# A full commit SHA can never be a ``--branch`` argument.
+_COMMIT_SHA_RE = re.compile(r"[0-9a-fA-F]{40}")
+
+GIT_TIMEOUT = 300  # seconds for the whole clone + checkout
 
-def _auto_clone(repo_url: str, version: str, workspace_dir: str | None = None) -> str:
+
+def _run_git(*args: str, deadline: float | None = None) -> None:
+    """Run git, raising ``CalledProcessError`` / ``TimeoutExpired``.
+
+    git runs in its own session so that on timeout the whole process group
+    (remote helpers, index-pack) is killed, not just the top-level git.
+    """
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    with subprocess.Popen(
+        ["git", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.communicate()
+            raise
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, stdout, stderr)
+
+
+def _reset_dir(path: str) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def _blobless_clone(repo_url: str, dest: str, deadline: float | None = None) -> None:
+    """``git clone --filter=blob:none --no-checkout``, plain clone on git < 2.19."""
+    try:
+        _run_git("clone", "--filter=blob:none", "--no-checkout", repo_url, dest, deadline=deadline)
+    except subprocess.CalledProcessError as e:
+        if "unknown option" not in (e.stderr or ""):
+            raise
+        logger.info("git does not support partial clone, falling back to full clone")
+        _reset_dir(dest)
+        _run_git("clone", "--no-checkout", repo_url, dest, deadline=deadline)
+
+
+def _auto_clone(
+    repo_url: str,
+    version: str,
+    workspace_dir: str | None = None,
+    timeout: float = GIT_TIMEOUT,
+) -> str:
     """Clone a repo and checkout the given version.
 
+    Tries the cheapest transfer first:
+
+    - branch/tag: shallow ``--depth 1 --branch`` clone;
+    - full commit SHA: shallow fetch of exactly that commit (needs the
+      server to allow fetching by SHA, which GitHub does);
+    - otherwise: blobless clone (history without file contents) + checkout,
+      which downloads only the blobs of the checked-out commit.
+
+    All git commands share one *timeout* budget; when it runs out the
+    clone is killed and no fallback is attempted.
+
     Raises ``RuntimeError`` on failure (unlike the CLI version which returns None).
     """
     base = Path(workspace_dir) if workspace_dir else Path.cwd() / "workspace"
     base.mkdir(parents=True, exist_ok=True)
     tmpdir = tempfile.mkdtemp(prefix="clone-", dir=base)
+    deadline = time.monotonic() + timeout
+    git = functools.partial(_run_git, deadline=deadline)
 
     try:
-        subprocess.run(
-            ["git", "clone", "--depth", "1", "--branch", version, repo_url, tmpdir],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return tmpdir
-    except subprocess.CalledProcessError:
-        # --branch may fail for commit hashes; try full clone + checkout
-        shutil.rmtree(tmpdir, ignore_errors=True)
-        os.makedirs(tmpdir, exist_ok=True)
         try:
-            subprocess.run(
-                ["git", "clone", repo_url, tmpdir],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            subprocess.run(
-                ["git", "-C", tmpdir, "checkout", version],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            if _COMMIT_SHA_RE.fullmatch(version):
+                git("init", "-q", tmpdir)
+                git("-C", tmpdir, "fetch", "-q", "--depth", "1", repo_url, version)
+                git("-C", tmpdir, "checkout", "-q", "--detach", "FETCH_HEAD")
+            else:
+                git("clone", "--depth", "1", "--branch", version, repo_url, tmpdir)
             return tmpdir
-        except subprocess.CalledProcessError as e:
-            shutil.rmtree(tmpdir, ignore_errors=True)
-            raise RuntimeError(
-                f"Git clone/checkout failed for {repo_url}@{version}: {e.stderr}"
-            ) from e
+        except subprocess.CalledProcessError:
+            # --branch fails for abbreviated hashes, fetch-by-SHA may be refused
+            _reset_dir(tmpdir)
+
+        _blobless_clone(repo_url, tmpdir, deadline=deadline)
+        git("-C", tmpdir, "checkout", version)
+        return tmpdir
+    except subprocess.TimeoutExpired as e:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise RuntimeError(f"git clone timed out after {timeout}s for {repo_url}@{version}") from e
+    except subprocess.CalledProcessError as e:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise RuntimeError(f"Git clone/checkout failed for {repo_url}@{version}: {e.stderr}") from e
@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
 
-class CallType(Enum):
-    """Function call type. v1 only has DIRECT and FPTR."""
+class CallType(IntEnum):
+    """
+    Function call type. v1 only has DIRECT and FPTR.
+    Int-valued so comparisons are int compares and the value fits in a byte;
+    :attr:`label` is the lowercase string stored on Neo4j CALLS edges.
+    """
+
+    DIRECT = 0
+    FPTR = 1
 
-    DIRECT = "direct"
-    FPTR = "fptr"
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
 
-@dataclass
+# Backends build these by the hundred thousand. Slotted to drop the per-instance
+# __dict__; deliberately not frozen, since a frozen __init__ assigns through
+# object.__setattr__ and is several times slower to construct.
+@dataclass(slots=True)
 class FunctionRecord:
     """
     Function record produced by an analysis backend.
@@ -36,12 +48,18 @@ class FunctionRecord:
     confidence: float = 1.0
     source_backend: str = ""
 
+    def __post_init__(self) -> None:
+        # Names and paths repeat across a call graph; share one object each.
+        self.name = sys.intern(self.name)
+        self.file_path = sys.intern(self.file_path)
+
 
-@dataclass
+@dataclass(slots=True)
 class CallEdge:
     """
     Call relationship between two functions.
     Carries call type and confidence for ResultMerger decisions.
+    ``call_type`` is an int-valued CallType; serialize it with ``.label``.
     """
 
     caller: str
@@ -54,8 +72,15 @@ class CallEdge:
     confidence: float = 1.0
     source_backend: str = ""
 
+    def __post_init__(self) -> None:
+        self.caller = sys.intern(self.caller)
+        self.callee = sys.intern(self.callee)
+        self.call_site_file = sys.intern(self.call_site_file)
+        self.caller_file = sys.intern(self.caller_file)
+        self.callee_file = sys.intern(self.callee_file)
+
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class AnalysisResult:
     """
     Complete output from a static analysis backend.
@@ -72,7 +97,7 @@ class AnalysisResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class FuzzerInfo:
     """Complete info for writing a Neo4j :Fuzzer node."""
 
@@ -0,0 +1,97 @@
+"""Struct-of-arrays edge storage used by ResultMerger."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from z_code_analyzer.backends.base import CallEdge, CallType
+
+# CallType values are 0..n-1, so a tuple maps stored codes back to members.
+_CALL_TYPES: tuple[CallType, ...] = tuple(CallType)
+
+
+def _int_column() -> array:
+    return array("i")
+
+
+@dataclass
+class EdgeTable:
+    """
+    Column-oriented (SoA) view of a list of CallEdge.
+
+    Every CallEdge field is one typed array; row ``i`` across all columns is
+    one edge. Strings (function names, file paths, backend names) are stored
+    once in ``name_pool`` and referenced by int32 id, so identical names are
+    shared and edges can be keyed by integer pairs.
+
+    Backends keep producing ``list[CallEdge]``; convert with
+    :meth:`from_edges` / :meth:`to_edges`. ``confidence`` is stored as a
+    double so conversion round-trips exactly.
+    """
+
+    caller_ids: array = field(default_factory=_int_column)
+    callee_ids: array = field(default_factory=_int_column)
+    call_type: array = field(default_factory=lambda: array("B"))
+    confidence: array = field(default_factory=lambda: array("d"))
+    line: array = field(default_factory=_int_column)
+    call_site_file_ids: array = field(default_factory=_int_column)
+    caller_file_ids: array = field(default_factory=_int_column)
+    callee_file_ids: array = field(default_factory=_int_column)
+    backend_ids: array = field(default_factory=_int_column)
+    name_pool: list[str] = field(default_factory=list)
+    name_to_id: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.caller_ids)
+
+    def intern(self, value: str) -> int:
+        """Return the pool id for *value*, adding it on first sight."""
+        idx = self.name_to_id.get(value)
+        if idx is None:
+            idx = len(self.name_pool)
+            self.name_pool.append(value)
+            self.name_to_id[value] = idx
+        return idx
+
+    def extend(self, edges: Iterable[CallEdge]) -> None:
+        """Append *edges* as new rows."""
+        intern = self.intern
+        for e in edges:
+            self.caller_ids.append(intern(e.caller))
+            self.callee_ids.append(intern(e.callee))
+            self.call_type.append(e.call_type)
+            self.confidence.append(e.confidence)
+            self.line.append(e.call_site_line)
+            self.call_site_file_ids.append(intern(e.call_site_file))
+            self.caller_file_ids.append(intern(e.caller_file))
+            self.callee_file_ids.append(intern(e.callee_file))
+            self.backend_ids.append(intern(e.source_backend))
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[CallEdge]) -> EdgeTable:
+        table = cls()
+        table.extend(edges)
+        return table
+
+    def row(self, i: int) -> CallEdge:
+        """Materialize row *i* as a CallEdge."""
+        pool = self.name_pool
+        return CallEdge(
+            caller=pool[self.caller_ids[i]],
+            callee=pool[self.callee_ids[i]],
+            call_type=_CALL_TYPES[self.call_type[i]],
+            call_site_file=pool[self.call_site_file_ids[i]],
+            call_site_line=self.line[i],
+            caller_file=pool[self.caller_file_ids[i]],
+            callee_file=pool[self.callee_file_ids[i]],
+            confidence=self.confidence[i],
+            source_backend=pool[self.backend_ids[i]],
+        )
+
+    def to_edges(self, rows: Iterable[int] | None = None) -> list[CallEdge]:
+        """Materialize *rows* (default: all, in order) as CallEdge objects."""
+        if rows is None:
+            rows = range(len(self))
+        return [self.row(i) for i in rows]
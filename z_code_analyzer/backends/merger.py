@@ -1,15 +1,96 @@
-"""Result merger — v1 only implements single-backend passthrough."""
+"""Result merger — single-backend passthrough, confidence-based multi-backend merge."""
 
 from __future__ import annotations
 
-from z_code_analyzer.backends.base import AnalysisResult
+import itertools
+import logging
+import os
+from array import array
+
+from z_code_analyzer.backends.base import AnalysisResult, FunctionRecord
+from z_code_analyzer.backends.edge_table import EdgeTable
+
+logger = logging.getLogger(__name__)
+
+# Optional numba acceleration for the edge dedup loop (opt-in: ZVS_USE_NUMBA=1).
+# Compiled code is cached on disk, so only the first run pays the JIT cost.
+_USE_NUMBA = False
+if os.environ.get("ZVS_USE_NUMBA") == "1":
+    try:
+        import numba
+        import numpy as np
+
+        @numba.njit(cache=True)
+        def _best_edge_rows_jit(caller_ids, callee_ids, confidences):
+            slot = numba.typed.Dict.empty(numba.types.int64, numba.types.int64)
+            best = np.empty(len(caller_ids), np.int64)
+            n = 0
+            for i in range(len(caller_ids)):
+                key = (np.int64(caller_ids[i]) << 32) | np.int64(callee_ids[i])
+                if key not in slot:
+                    slot[key] = n
+                    best[n] = i
+                    n += 1
+                else:
+                    j = slot[key]
+                    if confidences[i] > confidences[best[j]]:
+                        best[j] = i
+            return best[:n]
+
+        _USE_NUMBA = True
+    except ImportError:
+        logger.info("ZVS_USE_NUMBA=1 but numba is not available, using pure-Python merge")
+
+
+def _best_edge_rows_py(caller_ids: array, callee_ids: array, confidences: array) -> list[int]:
+    """Pure-Python twin of ``_best_edge_rows_jit``."""
+    slot: dict[tuple[int, int], int] = {}
+    best: list[int] = []
+    for i, key in enumerate(zip(caller_ids, callee_ids, strict=True)):
+        j = slot.get(key)
+        if j is None:
+            slot[key] = len(best)
+            best.append(i)
+        elif confidences[i] > confidences[best[j]]:
+            best[j] = i
+    return best
+
+
+def _best_edge_rows(table: EdgeTable) -> list[int]:
+    """
+    Pick one row per (caller, callee) pair: the highest confidence, ties
+    going to the earliest row (i.e. the higher-priority backend).
+    Rows are returned in order of each pair's first appearance.
+    """
+    if _USE_NUMBA:
+        rows = _best_edge_rows_jit(
+            np.frombuffer(table.caller_ids, dtype=np.int32),
+            np.frombuffer(table.callee_ids, dtype=np.int32),
+            np.frombuffer(table.confidence, dtype=np.float64),
+        )
+        return rows.tolist()
+    return _best_edge_rows_py(table.caller_ids, table.callee_ids, table.confidence)
+
+
+def _best_functions(results: list[AnalysisResult]) -> list[FunctionRecord]:
+    """One FunctionRecord per (name, file_path), highest confidence first-wins."""
+    best: dict[tuple[str, str], FunctionRecord] = {}
+    for r in results:
+        for f in r.functions:
+            key = (f.name, f.file_path)
+            cur = best.get(key)
+            if cur is None or f.confidence > cur.confidence:
+                best[key] = f
+    return list(best.values())
 
 
 class ResultMerger:
     """
     Merge results from multiple backends.
-    v1: single backend passthrough (no actual merging needed).
-    v2: will merge SVF + Joern results with conflict resolution.
+    Single result: passthrough.
+    Multiple results: union of functions and edges; duplicates (same
+    (name, file_path) / same (caller, callee)) resolved by confidence,
+    ties going to the earlier (higher-precision) result.
     """
 
     @staticmethod
@@ -20,9 +101,9 @@ class ResultMerger:
         """Merge multiple AnalysisResults into one.
 
         Args:
-            results: Analysis results to merge.
+            results: Analysis results to merge, highest precision first.
             priority_order: Backend priority (highest precision first).
-                v1 ignores this (single backend passthrough).
+                Currently ignored — *results* order is used.
         """
         if not results:
             raise ValueError("No results to merge")
@@ -30,15 +111,16 @@ class ResultMerger:
         if len(results) == 1:
             return results[0]
 
-        # v2: implement proper merging with confidence-based conflict resolution
-        # For now, just use the first (highest precision) result
         primary = results[0]
+        table = EdgeTable()
+        for r in results:
+            table.extend(r.edges)
         return AnalysisResult(
-            functions=primary.functions,
-            edges=primary.edges,
+            functions=_best_functions(results),
+            edges=table.to_edges(_best_edge_rows(table)),
             language=primary.language,
             backend="+".join(r.backend for r in results),
             analysis_duration_seconds=sum(r.analysis_duration_seconds for r in results),
-            warnings=sum((r.warnings for r in results), []),
+            warnings=list(itertools.chain.from_iterable(r.warnings for r in results)),
             metadata={"merged_from": [r.backend for r in results]},
         )
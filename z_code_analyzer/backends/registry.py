@@ -40,15 +40,28 @@ class BackendDescriptor:
 
 
 class BackendRegistry:
-    """Backend registration center."""
+    """
+    Backend registration center.
+
+    Per-language candidate lists and the selected backend are cached;
+    :meth:`register` and :meth:`invalidate` drop both caches.
+    """
 
     def __init__(self) -> None:
         self._backends: dict[str, BackendDescriptor] = {}
+        self._by_language: dict[str, list[BackendDescriptor]] = {}
+        self._best_by_lang: dict[str, AnalysisBackend] = {}
 
     def register(self, descriptor: BackendDescriptor) -> None:
         self._backends[descriptor.name] = descriptor
+        self.invalidate()
         logger.info("Registered backend: %s", descriptor.name)
 
+    def invalidate(self) -> None:
+        """Drop cached lookups, e.g. after Docker or an image becomes available."""
+        self._by_language.clear()
+        self._best_by_lang.clear()
+
     def get(self, name: str) -> BackendDescriptor | None:
         return self._backends.get(name)
 
@@ -57,11 +70,15 @@ class BackendRegistry:
 
     def find_by_language(self, language: str) -> list[BackendDescriptor]:
         """Filter by language, sorted by precision_score descending."""
-        return sorted(
-            [d for d in self._backends.values() if language in d.supported_languages],
-            key=lambda d: d.precision_score,
-            reverse=True,
-        )
+        cached = self._by_language.get(language)
+        if cached is None:
+            cached = sorted(
+                [d for d in self._backends.values() if language in d.supported_languages],
+                key=lambda d: d.precision_score,
+                reverse=True,
+            )
+            self._by_language[language] = cached
+        return list(cached)
 
     def find_by_capability(self, cap: BackendCapability) -> list[BackendDescriptor]:
         return [d for d in self._backends.values() if cap in d.capabilities]
@@ -74,7 +91,13 @@ class BackendRegistry:
         """
         Find the best available backend for a language.
         Tries backends in precision order, checking prerequisites.
+        The first backend that passes is cached per language, so later calls
+        skip the (slow) prerequisite checks.
         """
+        cached = self._best_by_lang.get(language)
+        if cached is not None:
+            return cached
+
         candidates = self.find_by_language(language)
         for desc in candidates:
             try:
@@ -91,6 +114,7 @@ class BackendRegistry:
                 logger.info(
                     "Selected backend: %s (precision=%.2f)", desc.name, desc.precision_score
                 )
+                self._best_by_lang[language] = backend
                 return backend
             logger.info(
                 "Backend %s prerequisites not met: %s",
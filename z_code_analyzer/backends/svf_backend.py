@@ -5,12 +5,29 @@ Requires Docker with svftools/svf image.
 
 from __future__ import annotations
 
+import atexit
+import gzip
+import hashlib
 import logging
+import multiprocessing
+import os
+import pickle
+import re
+import shutil
 import subprocess
+import sys
 import tempfile
+import threading
 import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AbstractContextManager, contextmanager
+from fnmatch import fnmatch
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from z_code_analyzer.backends.base import (
     AnalysisBackend,
@@ -22,7 +39,7 @@ from z_code_analyzer.backends.base import (
 from z_code_analyzer.exceptions import SVFError
 from z_code_analyzer.svf.svf_dot_parser import (
     get_all_function_names,
-    get_typed_edge_list,
+    iter_typed_edges,
     parse_svf_dot,
 )
 
@@ -30,6 +47,273 @@ logger = logging.getLogger(__name__)
 
 SVF_DOCKER_IMAGE = "svftools/svf"
 SVF_TIMEOUT = 600  # 10 minutes max for SVF analysis
+# DOT output cache, keyed by bitcode hash + SVF image id
+SVF_CACHE_DIR = Path(
+    os.environ.get("ZCA_SVF_CACHE_DIR", Path.home() / ".cache" / "z_code_analyzer" / "svf")
+)
+# Total size the DOT cache may grow to; least recently used entries go first
+SVF_CACHE_MAX_BYTES = 10 * 1024**3
+# Default wpa flags. -node-alloc-strat=dense numbers memory objects 0..N so
+# Andersen's points-to bit-vectors stay small; SVF's maintainers recommend
+# it for large bitcode (lower peak RSS, faster set unions).
+# -stat=false: skip the statistics dump, by far the bulk of wpa's output.
+SVF_FLAGS = ("-ander", "-node-alloc-strat=dense", "-stat=false")
+# RAM-backed /output in the worker container: DOT files never touch disk
+SVF_TMPFS_SIZE = "2g"
+
+# Validate bitcode file names to prevent command injection via malicious
+# filenames. Only allow alphanumeric, dots, hyphens, underscores.
+_BC_NAME_RE = re.compile(r"[\w.\-]+")
+
+# Parsed call graph: (function names, final adjacency, initial adjacency or None)
+_Graph = tuple[list[str], dict[str, set[str]], dict[str, set[str]] | None]
+# Parsed graph stored next to the DOT files of a cache entry
+_GRAPH_CACHE_NAME = "graph.v1.pickle"
+
+# Opens one DOT output for line-by-line reading. Built from module-level
+# functions via functools.partial so it can be sent to a worker process.
+DotSource = Callable[[], AbstractContextManager[IO[str]]]
+
+
+def _open_dot(path: Path) -> IO[str]:
+    """Open a DOT file (plain or cached .gz) for line-by-line reading."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt")
+    return open(path)
+
+
+@contextmanager
+def _docker_cat(container: str, path: str) -> Iterator[IO[str]]:
+    """Stream *path* out of *container*, e.g. from the worker's /output tmpfs."""
+    with subprocess.Popen(
+        ["docker", "exec", container, "cat", path],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as proc:
+        yield proc.stdout
+        proc.stdout.read()  # drain so cat can exit if the reader stopped early
+    if proc.returncode != 0:
+        raise SVFError(f"Could not read {path} from SVF worker (exit {proc.returncode})")
+
+
+def _tail(f: IO[bytes], size: int) -> str:
+    """Decode the last *size* bytes of a log file."""
+    f.seek(0, os.SEEK_END)
+    f.seek(max(0, f.tell() - size))
+    return f.read().decode(errors="replace")
+
+
+# Start method for the DOT parse worker. analyze() runs alongside its own
+# svf-meta thread and, in the API process, asyncio executor threads; a
+# forked child inherits whatever locks those threads hold and can deadlock.
+# forkserver forks from a clean single-threaded server instead.
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+# Process pool for DOT parsing, shared by every analyze() call (and so by
+# analyze_many's threads) rather than one pool started per call; created on
+# first use and replaced if a worker dies.
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=_MP_CONTEXT
+            )
+            atexit.register(_parse_pool.shutdown)
+        return _parse_pool
+
+
+def _drop_parse_pool(pool: ProcessPoolExecutor) -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False)
+
+
+def _parse_dot_adj(source: DotSource) -> dict[str, set[str]]:
+    """Adjacency of one DOT source (runs in a worker process)."""
+    with source() as f:
+        return parse_svf_dot(f)[1]
+
+
+# Fields FunctionRecord reads from a meta; also stands in for external
+# functions (no debug info).
+_META_DEFAULTS = {"file_path": "", "line": 0, "end_line": 0, "content": ""}
+_META_KEYS = _META_DEFAULTS.keys()
+
+
+def _index_metas(function_metas: list[dict]) -> dict[str, dict]:
+    """
+    Map ir_name and original_name to their metadata; later entries win.
+    Keys are interned like the DOT names they are looked up with. Values
+    carry every ``_META_DEFAULTS`` key: metas that lack one (the
+    orchestrator always sends complete ones) are copied and filled in.
+    """
+
+    def _pairs() -> Iterator[tuple[str, dict]]:
+        for meta in function_metas:
+            if not meta.keys() >= _META_KEYS:
+                meta = _META_DEFAULTS | meta
+            ir = sys.intern(meta.get("ir_name", ""))
+            original = sys.intern(meta.get("original_name", ""))
+            if ir:
+                yield ir, meta
+            if original and original != ir:
+                yield original, meta
+
+    return dict(_pairs())
+
+
+def _container_gone(returncode: int, stderr: str) -> bool:
+    """Whether a failed ``docker exec`` means the container itself is gone."""
+    return returncode == 125 or "No such container" in stderr or "is not running" in stderr
+
+
+class _SVFWorker:
+    """
+    Long-lived SVF container that analyses run in via ``docker exec``.
+
+    Inputs are staged in a host directory bind-mounted read-only at
+    ``/work``; SVF writes its DOT files to a tmpfs at ``/output``, which are
+    streamed back with ``docker exec cat``. Each run gets its own
+    subdirectory in both, so concurrent runs don't collide and the
+    container never needs remounting. If the container disappears (daemon
+    restart, ``docker rm``, OOM kill) the next exec notices and starts a
+    new one. Removed at interpreter exit.
+
+    *cpus* / *memory* become ``docker run --cpus`` / ``--memory``; None
+    leaves Docker's default of no limit.
+    """
+
+    def __init__(
+        self,
+        image: str,
+        staging_dir: Path,
+        cpus: float | None = None,
+        memory: str | None = None,
+    ) -> None:
+        self.image = image
+        self.staging_dir = staging_dir
+        self.cpus = cpus
+        self.memory = memory
+        self.container: str | None = None
+        self._lock = threading.Lock()
+        atexit.register(self.stop)
+
+    def ensure(self) -> str:
+        """Return the running container's name, starting it on first use."""
+        with self._lock:
+            if self.container is None:
+                self.staging_dir.mkdir(parents=True, exist_ok=True)
+                name = f"z-svf-worker-{uuid.uuid4().hex[:8]}"
+                cmd = [
+                    "docker",
+                    "run",
+                    "-d",
+                    "--rm",
+                    "--name",
+                    name,
+                    "-v",
+                    f"{self.staging_dir}:/work:ro",
+                    "--tmpfs",
+                    f"/output:rw,size={SVF_TMPFS_SIZE},mode=1777",
+                ]
+                if self.cpus is not None:
+                    cmd += ["--cpus", str(self.cpus)]
+                if self.memory is not None:
+                    cmd += ["--memory", self.memory]
+                cmd += [self.image, "sleep", "infinity"]
+                try:
+                    subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=120)
+                except (subprocess.SubprocessError, FileNotFoundError) as e:
+                    stderr = getattr(e, "stderr", "") or ""
+                    raise SVFError(f"Failed to start SVF worker container: {stderr}") from e
+                logger.info("Started SVF worker container %s", name)
+                self.container = name
+            return self.container
+
+    def exec(
+        self, *args: str, timeout: float = 60, check: bool = False, retry: bool = True
+    ) -> subprocess.CompletedProcess[str]:
+        """``docker exec`` *args* in the worker, capturing text output.
+
+        If the container is gone it is restarted and *args* run once more
+        (unless *retry* is false). With *check*, a nonzero exit raises
+        SVFError carrying the command's stderr.
+        """
+        for attempt in range(2):
+            name = self.ensure()
+            result = subprocess.run(
+                ["docker", "exec", name, *args],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            if not _container_gone(result.returncode, result.stderr):
+                break
+            self.discard(name)
+            if attempt or not retry:
+                break
+        if check and result.returncode != 0:
+            raise SVFError(
+                f"SVF worker command {' '.join(args)!r} failed "
+                f"(exit {result.returncode}): {result.stderr.strip()}"
+            )
+        return result
+
+    def discard(self, name: str) -> None:
+        """Forget container *name*, found gone; the next :meth:`ensure` starts a new one."""
+        with self._lock:
+            if self.container != name:
+                return  # another thread already replaced it
+            self.container = None
+        logger.warning("SVF worker container %s is gone; starting a new one", name)
+        try:
+            subprocess.run(["docker", "rm", "-f", name], capture_output=True, timeout=30)
+        except Exception:
+            pass
+
+    def stop(self) -> None:
+        """Remove the container (also kills any exec'd analysis)."""
+        with self._lock:
+            name, self.container = self.container, None
+        if name is None:
+            return
+        try:
+            subprocess.run(["docker", "rm", "-f", name], capture_output=True, timeout=30)
+        except Exception:
+            pass
+
+
+# One worker per (image, staging dir, cpus, memory), shared by all SVFBackend
+# instances — the orchestrator creates a fresh backend for every analysis.
+_workers: dict[tuple[str, Path, float | None, str | None], _SVFWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def _get_worker(
+    image: str, staging_dir: Path, cpus: float | None = None, memory: str | None = None
+) -> _SVFWorker:
+    key = (image, staging_dir, cpus, memory)
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is None:
+            worker = _workers[key] = _SVFWorker(*key)
+        return worker
+
+
+# Images whose prerequisites (Docker up, image present) were met in this
+# process. Failures are not remembered so a fixed environment is noticed.
+_prerequisites_ok: set[str] = set()
 
 
 class SVFBackend(AnalysisBackend):
@@ -37,14 +321,28 @@ class SVFBackend(AnalysisBackend):
     SVF-based static analysis backend for C/C++.
 
     Workflow:
-        BitcodeOutput.bc_path -> docker run svftools/svf wpa -ander -dump-callgraph
+        BitcodeOutput.bc_path -> docker exec <svf worker> wpa -ander -dump-callgraph
             -> callgraph_final.dot -> svf_dot_parser.parse() -> {functions, edges}
             -> merge with BitcodeOutput.function_metas (file_path, content)
             -> AnalysisResult
     """
 
-    def __init__(self, docker_image: str = SVF_DOCKER_IMAGE) -> None:
+    def __init__(
+        self,
+        docker_image: str = SVF_DOCKER_IMAGE,
+        cache_dir: str | Path | None = None,
+        svf_flags: list[str] | None = None,
+        cpu_limit: float | None = None,
+        mem_limit: str | None = None,
+    ) -> None:
         self._docker_image = docker_image
+        # Worker container limits (docker --cpus / --memory); None = unlimited
+        self._cpu_limit = cpu_limit
+        self._mem_limit = mem_limit
+        # Passed to wpa before -dump-callgraph; see SVF_FLAGS
+        self._svf_flags = list(svf_flags) if svf_flags is not None else list(SVF_FLAGS)
+        self._cache_dir = Path(cache_dir) if cache_dir else SVF_CACHE_DIR
+        self._image_id_cache: str | None = None
 
     @property
     def name(self) -> str:
@@ -89,9 +387,14 @@ class SVFBackend(AnalysisBackend):
             bc_path: str — path to library.bc
             function_metas: list[dict] — from BitcodeOutput, with keys:
                 ir_name, original_name, file_path, line, content
+
+        Optional kwargs:
+            use_cache: bool — reuse SVF output and its parsed graph cached
+                for identical bitcode, SVF image and flags (default True)
         """
         bc_path = kwargs.get("bc_path")
         function_metas = kwargs.get("function_metas", [])
+        use_cache = kwargs.get("use_cache", True)
 
         if not bc_path:
             raise SVFError("bc_path is required for SVF backend")
@@ -100,12 +403,23 @@ class SVFBackend(AnalysisBackend):
 
         start = time.monotonic()
 
-        # Run SVF in Docker — returns both initial and final DOT content
-        final_dot, initial_dot = self._run_svf_docker(bc_path)
-
-        # Parse both DOT files for call type classification
-        nodes, final_adj = parse_svf_dot(final_dot)
-        all_func_names = get_all_function_names(nodes)
+        # Build function metadata lookup from BitcodeOutput on a side thread
+        # while SVF runs (the wait on docker releases the GIL).
+        # Index by both ir_name (mangled, e.g. _Z3foov) and original_name (demangled, e.g. foo)
+        # so SVF DOT names (which use IR/mangled names) can find their metadata
+        index_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="svf-meta")
+        meta_future = index_pool.submit(_index_metas, function_metas)
+        index_pool.shutdown(wait=False)
+
+        # Reuse the graph parsed on an earlier run of the same bitcode, or
+        # run SVF (or hit the DOT cache) and parse its output
+        cache_key = self._cache_key(bc_path) if use_cache else None
+        graph = self._load_cached_graph(cache_key) if cache_key else None
+        if graph is None:
+            graph = self._parse_dot_graph(bc_path, cache_key)
+            if cache_key:
+                self._store_cached_graph(cache_key, graph)
+        all_func_names, final_adj, initial_adj = graph
 
         if not all_func_names:
             logger.warning(
@@ -113,68 +427,46 @@ class SVFBackend(AnalysisBackend):
                 "Check that the bitcode contains debug info."
             )
 
-        if initial_dot:
-            _, initial_adj = parse_svf_dot(initial_dot)
-            typed_edges = get_typed_edge_list(initial_adj, final_adj)
+        if initial_adj is not None:
+            typed_edges = iter_typed_edges(initial_adj, final_adj)
         else:
             # Fallback: if initial.dot not available, treat all as direct
             logger.warning("callgraph_initial.dot not found — all edges marked as DIRECT")
-            typed_edges = [(c, e, "direct") for c, es in final_adj.items() for e in es]
-
-        # Build function metadata lookup from BitcodeOutput
-        # Index by both ir_name (mangled, e.g. _Z3foov) and original_name (demangled, e.g. foo)
-        # so SVF DOT names (which use IR/mangled names) can find their metadata
-        meta_by_name: dict[str, dict] = {}
-        for meta in function_metas:
-            ir = meta.get("ir_name", "")
-            original = meta.get("original_name", "")
-            if ir:
-                meta_by_name[ir] = meta
-            if original and original != ir:
-                meta_by_name[original] = meta
-
-        # Build FunctionRecord list
-        functions = []
-        for func_name in sorted(all_func_names):
-            meta = meta_by_name.get(func_name)
-            if meta:
-                functions.append(
-                    FunctionRecord(
-                        name=func_name,
-                        file_path=meta.get("file_path", ""),
-                        start_line=meta.get("line", 0),
-                        end_line=meta.get("end_line", 0),
-                        content=meta.get("content", ""),
-                        language=language,
-                        source_backend="svf",
-                    )
-                )
-            else:
-                # External function (no debug info)
-                functions.append(
-                    FunctionRecord(
-                        name=func_name,
-                        file_path="",
-                        start_line=0,
-                        end_line=0,
-                        content="",
-                        language=language,
-                        source_backend="svf",
-                    )
-                )
-
-        # Build CallEdge list with call type from initial/final DOT diff
-        edges = []
+            typed_edges = ((c, e, "direct") for c, es in final_adj.items() for e in es)
+
+        meta_by_name = meta_future.result()
+
+        # Build FunctionRecord list; external functions (no debug info)
+        # get the empty defaults
+        functions = [
+            FunctionRecord(
+                name=func_name,
+                file_path=meta["file_path"],
+                start_line=meta["line"],
+                end_line=meta["end_line"],
+                content=meta["content"],
+                language=language,
+                source_backend="svf",
+            )
+            for func_name in all_func_names
+            for meta in (meta_by_name.get(func_name, _META_DEFAULTS),)
+        ]
+
+        # Build CallEdge list with call type from initial/final DOT diff,
+        # counting fptr edges in the same pass
+        file_by_name = {name: meta["file_path"] for name, meta in meta_by_name.items()}
+        edges: list[CallEdge] = []
+        fptr_count = 0
         for caller, callee, ctype in typed_edges:
-            caller_meta = meta_by_name.get(caller)
-            callee_meta = meta_by_name.get(callee)
+            is_fptr = ctype == "fptr"
+            fptr_count += is_fptr
             edges.append(
                 CallEdge(
                     caller=caller,
                     callee=callee,
-                    call_type=CallType.FPTR if ctype == "fptr" else CallType.DIRECT,
-                    caller_file=caller_meta.get("file_path", "") if caller_meta else "",
-                    callee_file=callee_meta.get("file_path", "") if callee_meta else "",
+                    call_type=CallType.FPTR if is_fptr else CallType.DIRECT,
+                    caller_file=file_by_name.get(caller, ""),
+                    callee_file=file_by_name.get(callee, ""),
                     source_backend="svf",
                 )
             )
@@ -189,102 +481,353 @@ class SVFBackend(AnalysisBackend):
             analysis_duration_seconds=round(duration, 2),
             metadata={
                 "node_count": len(all_func_names),
-                "edge_count": len(typed_edges),
-                "fptr_edge_count": sum(1 for _, _, ct in typed_edges if ct == "fptr"),
+                "edge_count": len(edges),
+                "fptr_edge_count": fptr_count,
                 "bc_path": bc_path,
             },
         )
 
-    def _run_svf_docker(self, bc_path: str) -> tuple[str, str | None]:
-        """Run SVF in Docker container.
-
-        Returns:
-            (final_dot_content, initial_dot_content_or_None)
+    def analyze_many(
+        self,
+        project_path: str,
+        language: str,
+        bc_paths: list[str],
+        function_metas_by_bc: dict[str, list[dict]] | None = None,
+        **kwargs: Any,
+    ) -> AnalysisResult:
         """
-        bc_path = str(Path(bc_path).resolve())
-        bc_dir = str(Path(bc_path).parent)
-        bc_name = Path(bc_path).name
+        Run :meth:`analyze` on several independent bitcode files at once.
 
-        # Validate bc_name to prevent command injection via malicious filenames.
-        # Only allow alphanumeric, dots, hyphens, underscores.
-        import re as _re
+        The runs share the warm worker, each in its own ``docker exec``;
+        wpa is single-threaded, so up to one run per host CPU proceeds in
+        parallel. Functions and edges are concatenated in *bc_paths* order.
+        A timeout in one run drops the worker and fails the others too.
 
-        if not _re.fullmatch(r"[\w.\-]+", bc_name):
-            raise SVFError(f"Invalid bitcode filename (contains special characters): {bc_name}")
+        Args:
+            bc_paths: Bitcode files, one per library.
+            function_metas_by_bc: bc_path -> function_metas for that file.
+            **kwargs: Passed to every :meth:`analyze` call (e.g. use_cache).
+        """
+        if not bc_paths:
+            raise SVFError("bc_paths is required for SVF batch analysis")
+        metas = function_metas_by_bc or {}
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(bc_paths))) as pool:
+            results = list(
+                pool.map(
+                    lambda bc: self.analyze(
+                        project_path,
+                        language,
+                        bc_path=bc,
+                        function_metas=metas.get(bc, []),
+                        **kwargs,
+                    ),
+                    bc_paths,
+                )
+            )
+        return AnalysisResult(
+            functions=[f for r in results for f in r.functions],
+            edges=[e for r in results for e in r.edges],
+            language=language,
+            backend="svf",
+            analysis_duration_seconds=round(time.monotonic() - start, 2),
+            metadata={
+                "node_count": sum(r.metadata["node_count"] for r in results),
+                "edge_count": sum(r.metadata["edge_count"] for r in results),
+                "fptr_edge_count": sum(r.metadata["fptr_edge_count"] for r in results),
+                "bc_paths": list(bc_paths),
+            },
+        )
 
-        # Use workspace dir for temp files — /tmp may not be mountable in Docker-in-Docker
-        ws_dir = Path.cwd() / "workspace"
-        ws_dir.mkdir(exist_ok=True)
-        with tempfile.TemporaryDirectory(dir=ws_dir) as tmpdir:
-            # Use --workdir instead of 'bash -c "cd ... && ..."' to avoid
-            # shell interpolation of bc_name entirely.
-            import uuid
-
-            container_name = f"z-svf-{uuid.uuid4().hex[:8]}"
-            cmd = [
-                "docker",
-                "run",
-                "--rm",
-                "--name",
-                container_name,
-                "--workdir",
-                "/output",
-                "-v",
-                f"{bc_dir}:/input:ro",
-                "-v",
-                f"{tmpdir}:/output",
-                self._docker_image,
-                "wpa",
-                "-ander",
-                "-dump-callgraph",
-                f"/input/{bc_name}",
-            ]
-
-            logger.info("Running SVF: %s", " ".join(cmd))
+    def _image_id(self) -> str | None:
+        """Content id of the SVF image, or None if Docker can't tell us."""
+        if self._image_id_cache is None:
             try:
                 result = subprocess.run(
-                    cmd,
+                    ["docker", "image", "inspect", "--format", "{{.Id}}", self._docker_image],
                     capture_output=True,
                     text=True,
-                    timeout=SVF_TIMEOUT,
+                    timeout=10,
                 )
-            except subprocess.TimeoutExpired as e:
-                # Kill the orphaned Docker container
+            except (subprocess.SubprocessError, FileNotFoundError):
+                return None
+            if result.returncode != 0 or not result.stdout.strip():
+                return None
+            self._image_id_cache = result.stdout.strip()
+        return self._image_id_cache
+
+    def _cache_key(self, bc_path: str) -> str | None:
+        """sha256 over bitcode bytes + image id + wpa flags; None disables caching."""
+        image_id = self._image_id()
+        if image_id is None:
+            return None
+        h = hashlib.sha256()
+        with open(bc_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        h.update(image_id.encode())
+        h.update("\0".join(self._svf_flags).encode())
+        return h.hexdigest()
+
+    def _load_cached_graph(self, key: str) -> _Graph | None:
+        try:
+            with open(self._cache_dir / key / _GRAPH_CACHE_NAME, "rb") as f:
+                graph = pickle.load(f)
+            self._touch_entry(key)
+            return graph
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError):
+            logger.warning("Ignoring unreadable SVF graph cache %s", key, exc_info=True)
+            return None
+
+    def _store_cached_graph(self, key: str, graph: _Graph) -> None:
+        """Pickle *graph* into the existing cache entry *key*, if there is one."""
+        entry = self._cache_dir / key
+        if not entry.is_dir():
+            return
+        try:
+            with tempfile.NamedTemporaryFile(dir=entry, prefix=".graph-", delete=False) as f:
+                pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, entry / _GRAPH_CACHE_NAME)
+        except OSError:
+            logger.warning("Could not write SVF graph cache %s", key, exc_info=True)
+        # The entry is complete now: make room for it
+        self._evict_cached(keep=key)
+
+    def _touch_entry(self, key: str) -> None:
+        """Mark entry *key* as just used; eviction goes by entry mtime."""
+        try:
+            os.utime(self._cache_dir / key)
+        except OSError:
+            pass
+
+    def _evict_cached(self, keep: str) -> None:
+        """Remove least recently used entries until the cache fits SVF_CACHE_MAX_BYTES."""
+        entries = []
+        total = 0
+        try:
+            for entry in os.scandir(self._cache_dir):
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue  # half-written entries belong to a running store
+                size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+                entries.append((entry.stat().st_mtime, size, entry))
+                total += size
+        except OSError:
+            logger.warning("Could not scan SVF cache %s", self._cache_dir, exc_info=True)
+            return
+        entries.sort(key=lambda e: e[0])
+        for _, size, entry in entries:
+            if total <= SVF_CACHE_MAX_BYTES:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+            total -= size
+            logger.info("Evicted SVF cache entry %s", entry.name[:12])
+
+    def _load_cached(self, key: str) -> tuple[Path, Path | None] | None:
+        entry = self._cache_dir / key
+        final = entry / "callgraph_final.dot.gz"
+        if not final.exists():
+            return None
+        self._touch_entry(key)
+        initial = entry / "callgraph_initial.dot.gz"
+        return final, initial if initial.exists() else None
+
+    def _store_cached(self, key: str, sources: dict[str, DotSource]) -> dict[str, DotSource]:
+        """Write *sources* (DOT file name → opener) to the cache entry *key*.
+
+        Returns openers for the stored copies, or *sources* itself if the
+        cache is not writable.
+        """
+        # Write into a sibling temp dir and rename, so readers never see a
+        # half-written entry.
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=self._cache_dir))
+            for name, open_src in sources.items():
+                with open_src() as fin, gzip.open(tmp / f"{name}.gz", "wt", 1) as fout:
+                    shutil.copyfileobj(fin, fout)
+            try:
+                tmp.rename(self._cache_dir / key)
+            except OSError:
+                shutil.rmtree(tmp, ignore_errors=True)  # another writer won
+        except OSError:
+            logger.warning("Could not write SVF cache entry %s", key, exc_info=True)
+            return sources
+        entry = self._cache_dir / key
+        return {name: partial(_open_dot, entry / f"{name}.gz") for name in sources}
+
+    def _parse_dot_graph(self, bc_path: str, cache_key: str | None) -> _Graph:
+        """Parse both DOT files line by line as they stream in.
+
+        The two parses are independent and CPU-bound: initial goes to the shared
+        worker pool while this one parses final.
+        """
+        with self._dot_files(bc_path, cache_key) as (open_final, open_initial):
+            if open_initial is None:
+                with open_final() as f:
+                    nodes, final_adj = parse_svf_dot(f)
+                initial_adj = None
+            else:
+                pool = _get_parse_pool()
+                initial_future = pool.submit(_parse_dot_adj, open_initial)
+                with open_final() as f:
+                    nodes, final_adj = parse_svf_dot(f)
                 try:
-                    subprocess.run(
-                        ["docker", "kill", container_name],
-                        capture_output=True,
-                        timeout=10,
-                    )
-                except Exception:
-                    pass
-                raise SVFError(f"SVF analysis timed out after {SVF_TIMEOUT}s") from e
+                    initial_adj = initial_future.result()
+                except BrokenProcessPool:
+                    logger.warning("DOT parse worker died; parsing initial graph in-process")
+                    _drop_parse_pool(pool)
+                    initial_adj = _parse_dot_adj(open_initial)
+        return get_all_function_names(nodes), final_adj, initial_adj
+
+    @contextmanager
+    def _dot_files(
+        self, bc_path: str, cache_key: str | None
+    ) -> Iterator[tuple[DotSource, DotSource | None]]:
+        """Yield (final, initial-or-None) DOT openers, from the cache or a fresh SVF run."""
+        cached = self._load_cached(cache_key) if cache_key else None
+        if cached is not None:
+            logger.info("SVF cache hit for %s (%s)", bc_path, cache_key[:12])
+            final_path, initial_path = cached
+            yield (
+                partial(_open_dot, final_path),
+                partial(_open_dot, initial_path) if initial_path else None,
+            )
+            return
+        with self._run_svf_docker(bc_path) as (final, initial, returncode):
+            # After a crash or OOM kill the output may be a partial graph:
+            # use it for this run, but never serve it as a cache hit
+            if cache_key and returncode != 0:
+                logger.warning("Not caching SVF output for %s: wpa exited %d", bc_path, returncode)
+            elif cache_key:
+                sources = {"callgraph_final.dot": final}
+                if initial is not None:
+                    sources["callgraph_initial.dot"] = initial
+                stored = self._store_cached(cache_key, sources)
+                final = stored["callgraph_final.dot"]
+                initial = stored.get("callgraph_initial.dot")
+            yield final, initial
+
+    @contextmanager
+    def _run_svf_docker(self, bc_path: str) -> Iterator[tuple[DotSource, DotSource | None, int]]:
+        """Run SVF in the shared warm worker container.
+
+        Yields:
+            (final_dot, initial_dot_or_None, wpa_exit_code); the openers
+            stream from the container's tmpfs and are valid until exit
+        """
+        bc = Path(bc_path).resolve()
+        bc_name = bc.name
 
-            if result.returncode != 0:
-                logger.warning("SVF stderr: %s", result.stderr[-2000:] if result.stderr else "")
-
-            # Find the callgraph DOT file — SVF may name it differently across versions
-            tmpdir_path = Path(tmpdir)
-            dot_files = list(tmpdir_path.glob("callgraph*.dot"))
-            if not dot_files:
-                all_files = list(tmpdir_path.iterdir())
-                raise SVFError(
-                    f"SVF did not produce callgraph_final.dot. "
-                    f"Files in output: {[f.name for f in all_files]}, "
-                    f"stdout: {result.stdout[-500:]}, stderr: {result.stderr[-500:]}"
-                )
-            # Prefer callgraph_final.dot, fall back to any callgraph*.dot
-            dot_final = tmpdir_path / "callgraph_final.dot"
-            if not dot_final.exists():
-                dot_final = dot_files[0]
-                logger.info("Using %s (callgraph_final.dot not found)", dot_final.name)
+        if not _BC_NAME_RE.fullmatch(bc_name):
+            raise SVFError(f"Invalid bitcode filename (contains special characters): {bc_name}")
 
-            dot_initial = Path(tmpdir) / "callgraph_initial.dot"
-            initial_content = dot_initial.read_text() if dot_initial.exists() else None
+        # Use workspace dir for staging — /tmp may not be mountable in Docker-in-Docker
+        worker = _get_worker(
+            self._docker_image,
+            Path.cwd() / "workspace" / "svf-worker",
+            self._cpu_limit,
+            self._mem_limit,
+        )
+        worker.ensure()  # also creates the staging dir
+        with tempfile.TemporaryDirectory(dir=worker.staging_dir) as tmpdir:
+            # Stage the bitcode (hard link when possible)
+            staged_bc = Path(tmpdir) / bc_name
+            try:
+                os.link(bc, staged_bc)
+            except OSError:
+                shutil.copyfile(bc, staged_bc)
 
-            return dot_final.read_text(), initial_content
+            run_id = Path(tmpdir).name
+            out_dir = f"/output/{run_id}"
+            try:
+                # A container that vanishes mid-run takes the run's output
+                # with it: start a new one and run once more
+                for attempt in range(2):
+                    worker.exec("mkdir", "-p", out_dir, check=True)
+                    container = worker.ensure()
+                    # Use --workdir instead of 'bash -c "cd ... && ..."' to avoid
+                    # shell interpolation of bc_name entirely.
+                    cmd = [
+                        "docker",
+                        "exec",
+                        "--workdir",
+                        out_dir,
+                        container,
+                        "wpa",
+                        *self._svf_flags,
+                        "-dump-callgraph",
+                        f"/work/{run_id}/{bc_name}",
+                    ]
+
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Running SVF: %s", " ".join(cmd))
+                    # wpa can log hundreds of MB; spool to disk and keep the tails
+                    with tempfile.TemporaryFile() as out_log, tempfile.TemporaryFile() as err_log:
+                        try:
+                            result = subprocess.run(
+                                cmd, stdout=out_log, stderr=err_log, timeout=SVF_TIMEOUT
+                            )
+                        except subprocess.TimeoutExpired as e:
+                            # Killing `docker exec` leaves wpa running in the container;
+                            # drop the whole worker, the next run starts a fresh one.
+                            worker.stop()
+                            raise SVFError(f"SVF analysis timed out after {SVF_TIMEOUT}s") from e
+                        stdout_tail = _tail(out_log, 500)
+                        stderr_tail = _tail(err_log, 2000)
+                    if attempt or not _container_gone(result.returncode, stderr_tail):
+                        break
+                    worker.discard(container)
+
+                if result.returncode != 0:
+                    logger.warning("SVF stderr: %s", stderr_tail)
+
+                # Find the callgraph DOT file — SVF may name it differently across versions
+                listing = worker.exec("ls", "-1", out_dir, retry=False)
+                outputs = listing.stdout.split()
+                dot_files = [f for f in outputs if fnmatch(f, "callgraph*.dot")]
+                if not dot_files:
+                    raise SVFError(
+                        f"SVF did not produce callgraph_final.dot "
+                        f"(wpa exit {result.returncode}). "
+                        f"Files in output: {outputs} {listing.stderr.strip()}, "
+                        f"stdout: {stdout_tail}, stderr: {stderr_tail[-500:]}"
+                    )
+                # Prefer callgraph_final.dot, fall back to any callgraph*.dot
+                dot_final = "callgraph_final.dot"
+                if dot_final not in dot_files:
+                    dot_final = dot_files[0]
+                    logger.info("Using %s (callgraph_final.dot not found)", dot_final)
+
+                yield (
+                    partial(_docker_cat, container, f"{out_dir}/{dot_final}"),
+                    partial(_docker_cat, container, f"{out_dir}/callgraph_initial.dot")
+                    if "callgraph_initial.dot" in dot_files
+                    else None,
+                    result.returncode,
+                )
+            finally:
+                # tmpfs is RAM — free it as soon as the run is consumed
+                if worker.container is not None:
+                    cleanup = worker.exec("rm", "-rf", out_dir, retry=False)
+                    if cleanup.returncode != 0:
+                        logger.warning(
+                            "Could not remove %s from SVF worker: %s",
+                            out_dir,
+                            cleanup.stderr.strip(),
+                        )
+
+    @staticmethod
+    def clear_prerequisites_cache() -> None:
+        """Forget images that passed :meth:`check_prerequisites`."""
+        _prerequisites_ok.clear()
 
     def check_prerequisites(self, project_path: str) -> list[str]:
+        if self._docker_image in _prerequisites_ok:
+            return []
         missing = []
         # Check Docker
         try:
@@ -313,4 +856,6 @@ class SVFBackend(AnalysisBackend):
         except (subprocess.SubprocessError, FileNotFoundError):
             pass  # Docker not available already reported
 
+        if not missing:
+            _prerequisites_ok.add(self._docker_image)
         return missing
@@ -8,7 +8,11 @@ from __future__ import annotations
 
 import logging
 import re
+import string
+import threading
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +27,83 @@ try:
 except ImportError:
     logger.info("tree-sitter-c not available, using regex-based parsing")
 
+# One tree-sitter Parser per thread, reused across files: a Parser must not
+# be shared by concurrent parse() calls
+_parser_local = threading.local()
+
+
+def _c_parser() -> Parser:
+    """This thread's C parser, created on first use."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = Parser(_C_LANGUAGE)
+    return parser
+
+
 # Regex fallback: match function calls like `func_name(...)` or `func_name (`
 _CALL_RE = re.compile(r"\b([a-zA-Z_]\w*)\s*\(")
-# Regex for function definitions: `type func_name(...)  {`
-_FUNC_DEF_RE = re.compile(
-    r"^[a-zA-Z_][\w\s\*]*?\b([a-zA-Z_]\w*)\s*\([^)]*\)\s*\{",
-    re.MULTILINE,
+# Tokens that matter when balancing a function body's braces: comments and
+# string/char literals (skipped whole, escapes included; an unterminated one
+# runs to the end) and the braces themselves
+_BODY_TOKEN_RE = re.compile(
+    r"/\*.*?(?:\*/|\Z)|//[^\n]*|\"(?:[^\"\\]|\\.)*\"?|'(?:[^'\\]|\\.)*'?|[{}]",
+    re.DOTALL,
+)
+# Keywords and builtins that _CALL_RE also matches but that are not calls
+_C_KEYWORDS = frozenset(
+    {
+        "if",
+        "for",
+        "while",
+        "switch",
+        "return",
+        "sizeof",
+        "typeof",
+        "alignof",
+        "__attribute__",
+        "defined",
+    }
 )
+# Function definitions are a line starting with a return type (letters,
+# whitespace, `*`) followed by `func_name(...) {`. As one regex,
+# `^[a-zA-Z_][\w\s\*]*?\b(name)\s*\(...`, every line start re-scans the
+# whole type run, which is quadratic on long runs of words; so the
+# `func_name(...) {` head is matched on its own and the type is checked by
+# walking back from it (see _iter_func_defs).
+_FUNC_HEAD_RE = re.compile(r"\b([a-zA-Z_]\w*)\s*\([^)]*\)\s*\{")
+_TYPE_CHARS_RE = re.compile(r"[\w\s*]*")
+_IDENT_START_CHARS = frozenset(string.ascii_letters + "_")
+
+
+def _iter_func_defs(content: str) -> Iterator[tuple[int, str]]:
+    """
+    Yield ``(line_start, func_name)`` for every function definition in
+    *content*, in order and non-overlapping; line_start is the offset of
+    the line its return type begins on.
+    """
+    pos = 0
+    while m := _FUNC_HEAD_RE.search(content, pos):
+        name_at = m.start()
+        # Walk back a line at a time while the text up to the name is all
+        # type characters; the earliest line start beginning with an
+        # identifier character is where the definition starts
+        start = -1
+        end = name_at
+        while True:
+            newline = content.rfind("\n", 0, end)
+            line = newline + 1
+            if line < pos or not _TYPE_CHARS_RE.fullmatch(content, line, end):
+                break
+            if line < name_at and content[line] in _IDENT_START_CHARS:
+                start = line
+            if newline < 0:
+                break
+            end = newline
+        if start >= 0:
+            yield start, m.group(1)
+            pos = m.end()
+        else:
+            pos = name_at + 1
 
 
 class FuzzerEntryParser:
@@ -65,11 +139,14 @@ class FuzzerEntryParser:
         if extra_search_paths:
             search_roots.extend(Path(p) for p in extra_search_paths)
 
-        for fuzzer_name, source_files in fuzzer_sources.items():
-            # Collect all function definitions and calls from this fuzzer's files
-            all_defs: dict[str, set[str]] = {}  # {func_name: {called_functions}}
-            all_defined: set[str] = set()
+        # Fuzzers often share sources (common helpers, or one harness built
+        # several ways): parse each file once, and expand each distinct list
+        # of files once
+        extracted: dict[Path, tuple[list[str], list[set[str]]]] = {}
+        expanded: dict[tuple[Path, ...], list[str]] = {}
 
+        for fuzzer_name, source_files in fuzzer_sources.items():
+            src_paths: list[Path] = []
             for src_file in source_files:
                 # Search in project_path first, then extra search paths
                 src_path = None
@@ -90,24 +167,35 @@ class FuzzerEntryParser:
                         [str(r) for r in search_roots],
                     )
                     continue
+                src_paths.append(src_path)
+
+            lib_calls = expanded.get(key := tuple(src_paths))
+            if lib_calls is None:
+                # Collect all function definitions and calls from this fuzzer's files
+                all_defs: dict[str, set[str]] = {}  # {func_name: {called_functions}}
+                all_defined: set[str] = set()
+                for src_path in src_paths:
+                    if src_path not in extracted:
+                        extracted[src_path] = self._extract_functions_and_calls(
+                            src_path.read_bytes()
+                        )
+                    defs, calls = extracted[src_path]
+                    for func_name, called in zip(defs, calls, strict=False):
+                        all_defs[func_name] = called
+                        all_defined.add(func_name)
+
+                # Recursively expand: start from LLVMFuzzerTestOneInput,
+                # follow calls to fuzzer-internal helpers, collect library function calls
+                lib_calls = expanded[key] = sorted(
+                    self._expand_calls(
+                        entry="LLVMFuzzerTestOneInput",
+                        func_defs=all_defs,
+                        fuzzer_defined=all_defined,
+                        library_functions=library_functions,
+                    )
+                )
 
-                content = src_path.read_text(errors="replace")
-                defs, calls = self._extract_functions_and_calls(content)
-
-                for func_name, called in zip(defs, calls, strict=False):
-                    all_defs[func_name] = called
-                    all_defined.add(func_name)
-
-            # Recursively expand: start from LLVMFuzzerTestOneInput,
-            # follow calls to fuzzer-internal helpers, collect library function calls
-            lib_calls = self._expand_calls(
-                entry="LLVMFuzzerTestOneInput",
-                func_defs=all_defs,
-                fuzzer_defined=all_defined,
-                library_functions=library_functions,
-            )
-
-            result[fuzzer_name] = sorted(lib_calls)
+            result[fuzzer_name] = list(lib_calls)
             logger.info(
                 "Fuzzer '%s': %d library functions called",
                 fuzzer_name,
@@ -148,41 +236,51 @@ class FuzzerEntryParser:
 
         return lib_calls
 
-    def _extract_functions_and_calls(self, content: str) -> tuple[list[str], list[set[str]]]:
+    def _extract_functions_and_calls(self, content: bytes) -> tuple[list[str], list[set[str]]]:
         """
-        Extract function definitions and their call sites.
+        Extract function definitions and their call sites from raw source.
+        tree-sitter parses the bytes as they are; only the regex fallback
+        needs them decoded.
 
         Returns:
             (func_names, calls_per_func) — parallel lists.
         """
         if _USE_TREE_SITTER:
             return self._extract_with_tree_sitter(content)
-        return self._extract_with_regex(content)
+        return self._extract_with_regex(content.decode(errors="replace"))
 
-    def _extract_with_tree_sitter(self, content: str) -> tuple[list[str], list[set[str]]]:
+    def _extract_with_tree_sitter(self, content: bytes) -> tuple[list[str], list[set[str]]]:
         """Use tree-sitter for accurate parsing."""
-        parser = Parser(_C_LANGUAGE)
-        tree = parser.parse(content.encode())
+        tree = _c_parser().parse(content)
 
         func_names: list[str] = []
         calls_per_func: list[set[str]] = []
 
-        for node in self._walk_tree(tree.root_node):
-            if node.type == "function_definition":
+        # One pre-order pass over the tree. Each node carries the call sets of
+        # the named functions enclosing it, so a call is credited to all of
+        # them (nested definitions included) without re-walking any subtree.
+        # The stack is explicit rather than recursive: no frame per node, and
+        # children go on reversed so they are visited in source order.
+        stack: list[tuple[Any, tuple[set[str], ...]]] = [(tree.root_node, ())]
+        while stack:
+            node, owners = stack.pop()
+            if node.type == "call_expression":
+                func = node.child_by_field_name("function")
+                if owners and func and func.type == "identifier":
+                    callee = func.text.decode()
+                    for calls in owners:
+                        calls.add(callee)
+            elif node.type == "function_definition":
                 name = self._get_func_name(node)
                 if name:
-                    calls = self._get_call_expressions(node)
+                    calls = set()
                     func_names.append(name)
                     calls_per_func.append(calls)
+                    owners = (*owners, calls)
+            stack.extend((child, owners) for child in reversed(node.children))
 
         return func_names, calls_per_func
 
-    def _walk_tree(self, node):
-        """Yield all nodes in the tree (top-level only for function defs)."""
-        yield node
-        for child in node.children:
-            yield from self._walk_tree(child)
-
     def _get_func_name(self, func_node) -> str | None:
         """Extract function name from a function_definition node."""
         declarator = func_node.child_by_field_name("declarator")
@@ -214,20 +312,6 @@ class FuzzerEntryParser:
 
         return None
 
-    def _get_call_expressions(self, node) -> set[str]:
-        """Collect all function call names within a subtree."""
-        calls: set[str] = set()
-        self._collect_calls(node, calls)
-        return calls
-
-    def _collect_calls(self, node, calls: set[str]) -> None:
-        if node.type == "call_expression":
-            func = node.child_by_field_name("function")
-            if func and func.type == "identifier":
-                calls.add(func.text.decode())
-        for child in node.children:
-            self._collect_calls(child, calls)
-
     def _extract_with_regex(self, content: str) -> tuple[list[str], list[set[str]]]:
         """Regex fallback for when tree-sitter is not available."""
         # Find function definitions and their bodies
@@ -236,77 +320,31 @@ class FuzzerEntryParser:
 
         # Simple approach: split by top-level function definitions
         # Find all function definitions
-        defs = list(_FUNC_DEF_RE.finditer(content))
-        if not defs:
-            return [], []
-
-        for _i, m in enumerate(defs):
-            func_name = m.group(1)
+        for def_start, func_name in _iter_func_defs(content):
             # Get function body using brace-counting for accurate boundary
-            brace_pos = content.find("{", m.start())
+            brace_pos = content.find("{", def_start)
             if brace_pos == -1:
                 continue
-            # Count braces, skipping comments and string literals
+            # Count braces, skipping comments and string literals; the regex
+            # engine jumps from one token that matters to the next
             depth = 1
-            pos = brace_pos + 1
-            limit = len(content)
-            in_block_comment = False
-            while pos < limit and depth > 0:
-                ch = content[pos]
-                if in_block_comment:
-                    if ch == "*" and pos + 1 < limit and content[pos + 1] == "/":
-                        in_block_comment = False
-                        pos += 2
-                        continue
-                    pos += 1
-                    continue
-                if ch == "/" and pos + 1 < limit:
-                    next_ch = content[pos + 1]
-                    if next_ch == "*":
-                        in_block_comment = True
-                        pos += 2
-                        continue
-                    if next_ch == "/":
-                        # Skip to end of line
-                        nl = content.find("\n", pos)
-                        pos = nl + 1 if nl != -1 else limit
-                        continue
-                if ch in ('"', "'"):
-                    # Skip string/char literal
-                    pos += 1
-                    while pos < limit:
-                        if content[pos] == "\\" and pos + 1 < limit:
-                            pos += 2
-                            continue
-                        if content[pos] == ch:
-                            break
-                        pos += 1
-                    pos += 1
-                    continue
-                if ch == "{":
+            body_end = len(content)
+            for tok in _BODY_TOKEN_RE.finditer(content, brace_pos + 1):
+                brace = tok.group()
+                if brace == "{":
                     depth += 1
-                elif ch == "}":
+                elif brace == "}":
                     depth -= 1
-                pos += 1
-            body = content[brace_pos + 1 : pos - 1]
+                    if depth == 0:
+                        body_end = tok.start()
+                        break
+            body = content[brace_pos + 1 : body_end]
 
             # Find all calls in body
             calls = set()
             for call_match in _CALL_RE.finditer(body):
                 callee = call_match.group(1)
-                # Filter out C keywords
-                if callee not in {
-                    "if",
-                    "for",
-                    "while",
-                    "switch",
-                    "return",
-                    "sizeof",
-                    "typeof",
-                    "alignof",
-                    "__attribute__",
-                    "defined",
-                }:
+                if callee not in _C_KEYWORDS:
                     calls.add(callee)
 
             func_names.append(func_name)
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable, Iterator, Sized
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +24,13 @@ _BATCH_SIZE = 500
 _MAX_PATH_DEPTH = 50
 
 
+def _batches(items: Iterable[Any], size: int = _BATCH_SIZE) -> Iterator[list[Any]]:
+    """Split *items* into lists of at most *size*, consuming it lazily."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
 class GraphStore:
     """
     Neo4j graph storage layer.
@@ -106,19 +115,19 @@ class GraphStore:
                 created_at=datetime.now(timezone.utc).isoformat(),
             )
 
-    def import_functions(self, snapshot_id: str, functions: list[FunctionRecord]) -> int:
+    def import_functions(self, snapshot_id: str, functions: Iterable[FunctionRecord]) -> int:
         """Batch import :Function nodes + (:Snapshot)-[:CONTAINS]->(:Function) edges.
 
         Uses MERGE on (snapshot_id, name, file_path) to prevent duplicates
-        if called more than once for the same snapshot.
+        if called more than once for the same snapshot. *functions* may be
+        a generator; it is consumed one batch at a time.
         """
-        if not functions:
+        if isinstance(functions, Sized) and not functions:
             return 0
 
         count = 0
         with self._session() as session:
-            for i in range(0, len(functions), _BATCH_SIZE):
-                batch = functions[i : i + _BATCH_SIZE]
+            for batch in _batches(functions):
                 params = []
                 for f in batch:
                     is_external = not f.file_path and not f.content
@@ -187,29 +196,29 @@ class GraphStore:
 
         return count
 
-    def import_edges(self, snapshot_id: str, edges: list[CallEdge]) -> int:
+    def import_edges(self, snapshot_id: str, edges: Iterable[CallEdge]) -> int:
         """Batch create (:Function)-[:CALLS]->(:Function) edges.
 
         When caller_file / callee_file are provided (non-empty), matches by
         (name, file_path) to avoid Cartesian products on duplicate names.
         When empty, falls back to name-only matching — if multiple functions
         share that name, picks the first by file_path order to stay
-        deterministic.
+        deterministic. *edges* may be a generator; it is consumed one batch
+        at a time.
         """
-        if not edges:
+        if isinstance(edges, Sized) and not edges:
             return 0
 
         count = 0
         with self._session() as session:
-            for i in range(0, len(edges), _BATCH_SIZE):
-                batch = edges[i : i + _BATCH_SIZE]
+            for batch in _batches(edges):
                 params = [
                     {
                         "caller": e.caller,
                         "callee": e.callee,
                         "caller_file": e.caller_file,
                         "callee_file": e.callee_file,
-                        "call_type": e.call_type.value,
+                        "call_type": e.call_type.label,
                         "confidence": e.confidence,
                         "backend": e.source_backend,
                     }
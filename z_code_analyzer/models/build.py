@@ -15,7 +15,9 @@ class BuildCommand:
     confidence: float = 1.0  # 1.0 (user) / 0.8 (auto) / 0.5 (llm)
 
 
-@dataclass
+# One per DISubprogram, so tens of thousands per library. Slotted like the
+# backend records to drop the per-instance __dict__.
+@dataclass(slots=True)
 class FunctionMeta:
     """Function metadata extracted from LLVM IR debug info (DISubprogram)."""
 
@@ -19,6 +19,9 @@ from z_code_analyzer.snapshot_manager import SnapshotManager
 
 logger = logging.getLogger(__name__)
 
+# Backend names accepted by analyze(); anything else falls back to SVF (v1).
+_ACCEPTED_BACKENDS = frozenset({"svf", "auto"})
+
 
 @dataclass
 class AnalysisOutput:
@@ -105,7 +108,7 @@ class StaticAnalysisOrchestrator:
         analysis_committed = False
 
         # v1: only SVF backend is supported
-        if backend and backend not in ("svf", "auto"):
+        if backend and backend not in _ACCEPTED_BACKENDS:
             logger.warning("Backend '%s' not supported in v1, falling back to 'svf'", backend)
         actual_backend = "svf"
 
@@ -27,6 +27,9 @@ WAIT_TIMEOUT = 1800  # 30 minutes
 DISK_THRESHOLD = 0.80  # Start evicting when disk usage exceeds 80%
 DISK_TARGET = 0.70  # Evict until usage drops below 70%
 
+# Fallback lookup order in find_snapshot, highest precision first
+BACKEND_PRECEDENCE = ("svf", "joern", "introspector", "prebuild")
+
 
 class SnapshotManager:
     """
@@ -87,7 +90,7 @@ class SnapshotManager:
                     return snap
 
             # Any backend for same version, prefer higher precision
-            for backend in ["svf", "joern", "introspector", "prebuild"]:
+            for backend in BACKEND_PRECEDENCE:
                 snap = session.scalars(
                     select(Snapshot).where(
                         Snapshot.repo_url == repo_url,
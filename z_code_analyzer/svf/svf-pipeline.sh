@@ -51,6 +51,17 @@ echo "=== [0/6] Installing wllvm + llvm-link ==="
 
 pip3 install wllvm 2>&1 | tail -3
 
+# /var/cache/apt/archives is a volume shared by all pipeline runs (see
+# PIPELINE_CACHE_VOLUMES in bitcode.py): keep downloaded .debs there and
+# serialize concurrent containers on it
+rm -f /etc/apt/apt.conf.d/docker-clean
+mkdir -p /var/cache/apt/archives/partial  # a fresh volume starts empty
+APT_LOCK=""
+if command -v flock &>/dev/null; then
+    APT_LOCK="flock /var/cache/apt/archives/.z-pipeline.lock"
+fi
+APT_INSTALL="apt-get install -y -qq -o APT::Keep-Downloaded-Packages=true"
+
 # Detect clang version and install matching llvm-link
 LLVM_VER=$(clang --version | grep -oP 'clang version \K[0-9]+')
 echo "Detected clang version: ${LLVM_VER}"
@@ -60,11 +71,11 @@ if command -v llvm-link &>/dev/null; then
     if [ "$EXISTING_VER" = "$LLVM_VER" ]; then
         echo "llvm-link-${LLVM_VER} already installed"
     else
-        apt-get update -qq && apt-get install -y -qq llvm-${LLVM_VER} 2>&1 | tail -3
+        $APT_LOCK apt-get update -qq && $APT_LOCK $APT_INSTALL llvm-${LLVM_VER} 2>&1 | tail -3
         ln -sf /usr/bin/llvm-link-${LLVM_VER} /usr/bin/llvm-link
     fi
 else
-    apt-get update -qq && apt-get install -y -qq llvm-${LLVM_VER} 2>&1 | tail -3
+    $APT_LOCK apt-get update -qq && $APT_LOCK $APT_INSTALL llvm-${LLVM_VER} 2>&1 | tail -3
     ln -sf /usr/bin/llvm-link-${LLVM_VER} /usr/bin/llvm-link
 fi
 # Symlink llvm-dis too (needed for .ll generation)
@@ -116,7 +127,9 @@ case "$BUILD_MODE" in
         if [ -f configure.ac ] || [ -f configure.in ]; then
             autoreconf -fi 2>&1 | tail -3
         fi
-        ./configure --disable-shared --enable-static \
+        # WLLVM_CONFIGURE_ONLY: configure's throwaway test programs need no
+        # bitcode, so skip wllvm's second (-emit-llvm) compile for them
+        WLLVM_CONFIGURE_ONLY=1 ./configure --disable-shared --enable-static \
             --prefix="$INSTALL_PREFIX" \
             ${CONFIGURE_FLAGS:-} 2>&1 | tail -5
         make -j$(nproc) 2>&1 | tail -5
@@ -128,7 +141,7 @@ case "$BUILD_MODE" in
     intree-cmake)
         mkdir -p "$PROJECT_SRC/build-svf"
         cd "$PROJECT_SRC/build-svf"
-        cmake .. \
+        WLLVM_CONFIGURE_ONLY=1 cmake .. \
             -DCMAKE_INSTALL_PREFIX="$INSTALL_PREFIX" \
             -DBUILD_SHARED_LIBS=OFF \
             ${CMAKE_FLAGS:-} 2>&1 | tail -5
@@ -12,33 +12,44 @@ Edges present in final but NOT in initial are function-pointer-resolved (FPTR).
 from __future__ import annotations
 
 import re
+import sys
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 
+_NODE_RE = re.compile(r"(Node0x[0-9a-fA-F]+)\s*\[[^;]*?fun:\s*(\S+?)\\")
+_EDGE_RE = re.compile(r"(Node0x[0-9a-fA-F]+)(?::s\d+)?\s*->\s*(Node0x[0-9a-fA-F]+)")
 
-def parse_svf_dot(content: str) -> tuple[dict[str, str], dict[str, set[str]]]:
+
+def parse_svf_dot(content: str | Iterable[str]) -> tuple[dict[str, str], dict[str, set[str]]]:
     """Parse SVF's callgraph DOT file.
 
     Args:
-        content: Raw content of a callgraph DOT file.
+        content: Raw content of a callgraph DOT file, or an iterable of its
+            lines (e.g. an open file) to parse without loading it whole.
 
     Returns:
         nodes: {node_id: function_name}
         adj: {caller_name: {callee_name, ...}}
     """
+    lines = content.splitlines() if isinstance(content, str) else content
     nodes: dict[str, str] = {}
+    edge_ids: list[tuple[str, str]] = []
+
+    # SVF writes one node or edge per line. Edges can precede the nodes
+    # they reference, so resolve ids to names after the pass.
+    for line in lines:
+        # Node0x5632abc [shape=record,shape=Mrecord,
+        #   label="{CallGraphNode ID: 42 \{fun: function_name\}|{<s0>...}}"];
+        if "fun:" in line and (m := _NODE_RE.search(line)):
+            # Interned: each name is shared by its node, adjacency entries
+            # and every record built from them
+            nodes[m.group(1)] = sys.intern(m.group(2))
+        # Node0x5632abc:s0 -> Node0x5632def
+        elif "->" in line and (m := _EDGE_RE.search(line)):
+            edge_ids.append((m.group(1), m.group(2)))
 
-    # SVF node format:
-    # Node0x5632abc [shape=record,shape=Mrecord,
-    #   label="{CallGraphNode ID: 42 \{fun: function_name\}|{<s0>...}}"];
-    for m in re.finditer(r"(Node0x[0-9a-fA-F]+)\s*\[[^;]*?fun:\s*(\S+?)\\", content):
-        nodes[m.group(1)] = m.group(2)
-
-    # SVF edge format:
-    # Node0x5632abc:s0 -> Node0x5632def
     adj: dict[str, set[str]] = defaultdict(set)
-    for m in re.finditer(r"(Node0x[0-9a-fA-F]+)(?::s\d+)?\s*->\s*(Node0x[0-9a-fA-F]+)", content):
-        src_id = m.group(1)
-        dst_id = m.group(2)
+    for src_id, dst_id in edge_ids:
         src = nodes.get(src_id)
         dst = nodes.get(dst_id)
         if src and dst and src != dst:  # filter self-loops and unknown nodes
@@ -47,9 +58,13 @@ def parse_svf_dot(content: str) -> tuple[dict[str, str], dict[str, set[str]]]:
     return nodes, adj
 
 
-def get_all_function_names(nodes: dict[str, str]) -> set[str]:
-    """Get all unique function names from parsed nodes."""
-    return set(nodes.values())
+def get_all_function_names(nodes: dict[str, str]) -> list[str]:
+    """Get all unique function names from parsed nodes, in DOT order.
+
+    One C-level pass over ``nodes``; cheaper than deduplicating names inside
+    parse_svf_dot's per-line loop.
+    """
+    return list(dict.fromkeys(nodes.values()))
 
 
 def get_edge_list(adj: dict[str, set[str]]) -> list[tuple[str, str]]:
@@ -61,23 +76,29 @@ def get_edge_list(adj: dict[str, set[str]]) -> list[tuple[str, str]]:
     return edges
 
 
-def get_typed_edge_list(
+def iter_typed_edges(
     initial_adj: dict[str, set[str]],
     final_adj: dict[str, set[str]],
-) -> list[tuple[str, str, str]]:
+) -> Iterator[tuple[str, str, str]]:
     """Classify edges as 'direct' or 'fptr' by diffing initial vs final graphs.
 
     Args:
         initial_adj: Adjacency from callgraph_initial.dot (direct calls only).
         final_adj: Adjacency from callgraph_final.dot (all calls after pointer analysis).
 
-    Returns:
-        List of (caller, callee, call_type) where call_type is 'direct' or 'fptr'.
+    Yields:
+        (caller, callee, call_type) where call_type is 'direct' or 'fptr'.
     """
-    edges: list[tuple[str, str, str]] = []
+    empty: set[str] = set()
     for caller, callees in sorted(final_adj.items()):
-        initial_callees = initial_adj.get(caller, set())
+        initial_callees = initial_adj.get(caller, empty)
         for callee in sorted(callees):
-            call_type = "direct" if callee in initial_callees else "fptr"
-            edges.append((caller, callee, call_type))
-    return edges
+            yield caller, callee, "direct" if callee in initial_callees else "fptr"
+
+
+def get_typed_edge_list(
+    initial_adj: dict[str, set[str]],
+    final_adj: dict[str, set[str]],
+) -> list[tuple[str, str, str]]:
+    """List form of :func:`iter_typed_edges`."""
+    return list(iter_typed_edges(initial_adj, final_adj))